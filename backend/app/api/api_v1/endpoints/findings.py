@@ -76,7 +76,7 @@ async def list_findings(
     
     return findings
 
-@router.get("/{finding_id}", response_model=schemas.Finding)
+@router.get("/{finding_id}", response_model=schemas.FindingDetail)
 def read_finding(
     *,
     db: Session = Depends(get_db),
@@ -102,7 +102,7 @@ def read_finding(
     
     return finding
 
-@router.patch("/{finding_id}", response_model=schemas.Finding)
+@router.patch("/{finding_id}", response_model=schemas.FindingDetail)
 def update_finding(
     *,
     db: Session = Depends(get_db),
@@ -138,7 +138,7 @@ def update_finding(
     
     return finding
 
-@router.delete("/{finding_id}", response_model=schemas.Finding)
+@router.delete("/{finding_id}", response_model=schemas.FindingDetail)
 def delete_finding(
     *,
     db: Session = Depends(get_db),
@@ -4,19 +4,24 @@ MCP (Multi-Component Protocol) API Endpoints
 This module provides the FastAPI router for the MCP server's HTTP API.
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from typing import Dict, Any, List, Optional
 import logging
 import json
+import msgspec
+import orjson
 
-from ....services.mcp_server import mcp_server, ToolDefinition, RegisteredAgent, ToolExecutionResult
+from ....services.mcp_server import mcp_server, ToolDefinition, RegisteredAgent
 from ....database import get_db, get_db_session
 from ....core.security import get_current_user, verify_api_key
 from ....models.user import User
 from ....schemas.mcp import (
     ToolRegistrationRequest,
     ToolExecutionRequest,
+    ToolExecutionPayload,
+    ToolExecutionResultResponse,
     AgentRegistrationRequest,
+    AgentStatusUpdateRequest,
     ExecutionLogFilter,
     PaginatedResponse
 )
@@ -24,6 +29,28 @@ from ....schemas.mcp import (
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
+def _encode_tool_result(result: Any) -> bytes:
+    """
+    Encode a tool result as JSON.
+    
+    msgspec handles the common case; tool handlers may return values it cannot
+    encode (e.g. sets or custom objects), so orjson with a ``str`` fallback is
+    tried before giving up with a 500.
+    """
+    try:
+        return msgspec.json.encode(result)
+    except (msgspec.EncodeError, TypeError, OverflowError) as e:
+        logger.warning(f"msgspec could not encode tool result, falling back to orjson: {str(e)}")
+    
+    try:
+        return orjson.dumps(result, default=str)
+    except (orjson.JSONEncodeError, TypeError) as e:
+        logger.error(f"Failed to encode tool result: {str(e)}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Tool result could not be encoded as JSON: {str(e)}"
+        )
+
 @router.post("/agents/register", response_model=RegisteredAgent)
 async def register_agent(
     request: Request,
@@ -61,6 +88,26 @@ async def register_agent(
             detail=f"Agent registration failed: {str(e)}"
         )
 
+@router.put("/agents/{agent_id}/status", response_model=RegisteredAgent)
+async def update_agent_status(
+    agent_id: str,
+    status_update: AgentStatusUpdateRequest,
+    current_user: User = Depends(get_current_user)
+) -> RegisteredAgent:
+    """
+    Change a registered agent's status.
+    
+    Inactive or suspended agents keep their registration but cannot execute
+    tools until they are set back to active.
+    """
+    try:
+        return mcp_server.set_agent_status(agent_id, status_update.status.value)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e)
+        )
+
 @router.post("/tools/register", status_code=status.HTTP_201_CREATED)
 async def register_tool(
     tool_data: ToolRegistrationRequest,
@@ -98,19 +145,38 @@ async def register_tool(
             detail=f"Tool registration failed: {str(e)}"
         )
 
-@router.post("/tools/execute/{tool_name}", response_model=ToolExecutionResult)
+@router.post(
+    "/tools/execute/{tool_name}",
+    response_model=ToolExecutionResultResponse,
+    openapi_extra={
+        "requestBody": {
+            "content": {"application/json": {"schema": ToolExecutionRequest.model_json_schema()}},
+            "required": True
+        }
+    }
+)
 async def execute_tool(
     tool_name: str,
-    execution_request: ToolExecutionRequest,
     request: Request,
     current_user: User = Depends(get_current_user)
-) -> ToolExecutionResult:
+) -> Response:
     """
     Execute a tool with the provided parameters.
     
     Only registered agents can execute tools. The agent must provide a valid
     agent_id and the tool must be registered with the MCP server.
+    
+    The body is decoded with msgspec rather than Pydantic since this is the
+    busiest MCP endpoint.
     """
+    try:
+        execution_request = msgspec.json.decode(await request.body(), type=ToolExecutionPayload)
+    except msgspec.DecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Invalid tool execution request: {str(e)}"
+        )
+    
     try:
         # Execute the tool
         result = await mcp_server.execute_tool(
@@ -130,8 +196,6 @@ async def execute_tool(
             }
         )
         
-        return result
-        
     except HTTPException:
         raise
     except Exception as e:
@@ -140,6 +204,11 @@ async def execute_tool(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Tool execution failed: {str(e)}"
         )
+    
+    return Response(
+        content=_encode_tool_result(result),
+        media_type="application/json"
+    )
 
 @router.get("/tools", response_model=List[Dict[str, Any]])
 async def list_tools(
@@ -197,7 +266,7 @@ async def get_execution_logs(
     """
     try:
         # Apply filters
-        logs = mcp_server.execution_log
+        logs = list(mcp_server.execution_log)
         
         if filter_params.agent_id:
             logs = [log for log in logs if log.get("agent_id") == filter_params.agent_id]
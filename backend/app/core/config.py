@@ -56,11 +56,18 @@ class Settings(BaseSettings):
     GITHUB_APP_ID: str = os.getenv("GITHUB_APP_ID", "")
     GITHUB_APP_PRIVATE_KEY: str = os.getenv("GITHUB_APP_PRIVATE_KEY", "")
     GITHUB_WEBHOOK_SECRET: str = os.getenv("GITHUB_WEBHOOK_SECRET", "")
+    # Installation tokens are refreshed this long before they expire
+    GITHUB_TOKEN_REFRESH_BUFFER_SECONDS: int = int(os.getenv("GITHUB_TOKEN_REFRESH_BUFFER_SECONDS", "300"))
+    # Repository analyses are reused for this long
+    GITHUB_ANALYSIS_CACHE_TTL_SECONDS: int = int(os.getenv("GITHUB_ANALYSIS_CACHE_TTL_SECONDS", "60"))
     
     # Slack settings
     SLACK_BOT_TOKEN: str = os.getenv("SLACK_BOT_TOKEN", "")
     SLACK_SIGNING_SECRET: str = os.getenv("SLACK_SIGNING_SECRET", "")
     
+    # Redis, shared by all workers (optional)
+    REDIS_URL: Optional[str] = os.getenv("REDIS_URL")
+    
     # MCP Server settings
     MCP_SERVER_ENABLED: bool = os.getenv("MCP_SERVER_ENABLED", "True").lower() in ("true", "1", "t")
     MCP_MAX_CONCURRENT_REQUESTS: int = int(os.getenv("MCP_MAX_CONCURRENT_REQUESTS", "100"))
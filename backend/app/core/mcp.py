@@ -14,6 +14,9 @@ from app.core.yaml_config import config  # Import YAML config
 
 from app.services.mcp_server import MCPServer, mcp_server
 from app.services.mcp_tools import register_all_tools
+from app.services.mcp_tools.github_tools import github_tools
+from app.services.mcp_tools.slack_tools import slack_tools
+from app.services.github_service import clear_workflow_content_cache
 from app.core.mcp_security import MCPAuthMiddleware, require_auth
 
 logger = logging.getLogger(__name__)
@@ -35,7 +38,8 @@ def setup_mcp_server(app: FastAPI) -> None:
     max_concurrent = config.get("mcp", {}).get("max_concurrent_requests", 10)
     development_mode = os.getenv("DEVELOPMENT_MODE", "False").lower() == "true"
     
-    # Initialize the MCP server
+    # Initialize the MCP server with a fresh workflow content cache
+    clear_workflow_content_cache()
     mcp_server.start()
     
     if development_mode:
@@ -99,7 +103,8 @@ def setup_mcp_server(app: FastAPI) -> None:
             mcp_server.stop()
             
             # Close any open connections, caches, etc.
-            pass
+            await github_tools.close()
+            await slack_tools.aclose()
         except Exception as e:
             logger.error(f"Error during shutdown: {str(e)}", exc_info=True)
     
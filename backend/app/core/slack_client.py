@@ -0,0 +1,47 @@
+"""
+Shared Slack Web API Client
+
+This module owns the single pooled HTTP client used for every Slack API call
+in the process, whether it comes from SlackService or the MCP Slack tools.
+"""
+from typing import Dict, Optional
+
+import httpx
+
+SLACK_API_URL = "https://slack.com/api"
+
+_client: Optional[httpx.AsyncClient] = None
+
+def get_slack_client() -> httpx.AsyncClient:
+    """Get the shared Slack API client, creating it on first use.
+    
+    The client carries no token; callers authenticate each request with
+    slack_auth_headers, so one connection pool serves every token.
+    """
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=SLACK_API_URL,
+            headers={
+                "Content-Type": "application/json; charset=utf-8"
+            },
+            timeout=30.0,
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=50,
+                keepalive_expiry=85.0
+            )
+        )
+    return _client
+
+async def close_slack_client() -> None:
+    """Close the shared Slack API client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+def slack_auth_headers(token: str) -> Dict[str, str]:
+    """Build the request headers that authenticate as a Slack token."""
+    return {"Authorization": f"Bearer {token}"}
@@ -1,7 +1,7 @@
 from fastapi import FastAPI, Depends, HTTPException, status, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.security import OAuth2PasswordBearer
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from typing import List, Optional, Dict, Any
 import logging
 import os
@@ -26,7 +26,9 @@ app = FastAPI(
     version="0.2.0",
     docs_url="/api/docs",
     redoc_url="/api/redoc",
-    openapi_url="/api/openapi.json"
+    openapi_url="/api/openapi.json",
+    # Analysis payloads are large and float-heavy; orjson encodes them in C
+    default_response_class=ORJSONResponse
 )
 
 # CORS middleware configuration
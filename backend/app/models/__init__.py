@@ -2,7 +2,7 @@ from .base import Base, BaseMixin
 
 # Import all models here to ensure they are registered with SQLAlchemy
 from .user import User, SlackIntegration
-from .repository import Repository, RepositoryProvider, RepositoryIntegration, RepositoryScan, ScanFinding, ScanFindingType, ScanFindingSeverity
+from .repository import Repository, RepositoryProvider, RepositoryIntegration, RepositoryScan, ScanFinding, ScanFindingType, ScanFindingSeverity, WorkflowAnalysisCache
 from .finding import Finding, FindingSeverity, FindingStatus
 from .recommendation import Recommendation, RecommendationStatus, RecommendationType
 
@@ -12,6 +12,7 @@ __all__ = [
     'User', 'SlackIntegration',
     'Repository', 'RepositoryProvider', 'RepositoryIntegration',
     'RepositoryScan', 'ScanFinding', 'ScanFindingType', 'ScanFindingSeverity',
+    'WorkflowAnalysisCache',
     'Finding', 'FindingSeverity', 'FindingStatus',
     'Recommendation', 'RecommendationStatus', 'RecommendationType'
 ]
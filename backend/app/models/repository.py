@@ -1,5 +1,5 @@
-from sqlalchemy import Column, String, Integer, ForeignKey, Enum, JSON, Float, Boolean, DateTime, Text
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, ForeignKey, Enum, JSON, Float, Boolean, DateTime, Text, UniqueConstraint
+from sqlalchemy.orm import relationship, deferred
 from .base import Base, BaseMixin
 import enum
 
@@ -87,17 +87,19 @@ class ScanFinding(Base, BaseMixin):
     finding_type = Column(Enum(ScanFindingType), nullable=False)
     severity = Column(Enum(ScanFindingSeverity), nullable=False)
     title = Column(String(255), nullable=False)
-    description = Column(String(2000))
+    description = Column(Text)
     file_path = Column(String(1000))
     line_number = Column(Integer)
-    code_snippet = Column(String(2000))
+    # Large text is deferred so list queries don't load it; accessing either
+    # column loads the whole "details" group in one query.
+    code_snippet = deferred(Column(Text), group="details")
     
     # Estimated impact
     estimated_cost_savings = Column(Float)  # in USD per month
     estimated_carbon_reduction = Column(Float)  # in kg CO2e per month
     
     # Fix details
-    recommended_fix = Column(String(2000))
+    recommended_fix = deferred(Column(Text), group="details")
     fix_difficulty = Column(String(50))  # easy, medium, hard
     fix_effort = Column(String(50))  # minutes, hours, days
     
@@ -109,3 +111,17 @@ class ScanFinding(Base, BaseMixin):
     # Relationships
     scan = relationship("RepositoryScan", back_populates="findings")
     pull_requests = relationship("PullRequest", back_populates="finding")
+
+class WorkflowAnalysisCache(Base, BaseMixin):
+    """Last analysis of a workflow together with the ETags it was computed from."""
+    __tablename__ = "workflow_analysis_cache"
+    __table_args__ = (UniqueConstraint("owner", "repo", "path"),)
+    
+    owner = Column(String(255), nullable=False)
+    repo = Column(String(255), nullable=False)
+    path = Column(String(1000), nullable=False)
+    
+    # ETags of the workflow file and its runs listing, sent back as If-None-Match
+    contents_etag = Column(String(255))
+    runs_etag = Column(String(255))
+    analysis = Column(JSON, nullable=False)
@@ -1,14 +1,22 @@
-from sqlalchemy import Column, String, Boolean, ForeignKey, JSON, Integer
+from sqlalchemy import Column, String, Boolean, ForeignKey, JSON, Integer, Index, text
 from sqlalchemy.orm import relationship
 from .base import Base, BaseMixin
 
 class User(Base, BaseMixin):
     """User model representing application users."""
     __tablename__ = "users"
+    __table_args__ = (
+        # Partial unique index: only users with an API key are indexed
+        Index(
+            "ix_users_api_key", "api_key", unique=True,
+            postgresql_where=text("api_key IS NOT NULL"),
+            sqlite_where=text("api_key IS NOT NULL")
+        ),
+    )
     
     email = Column(String(255), unique=True, index=True, nullable=False)
     hashed_password = Column(String(255), nullable=False)
-    api_key = Column(String(64), unique=True, index=True, nullable=True)
+    api_key = Column(String(64), nullable=True)
     full_name = Column(String(255))
     is_active = Column(Boolean, default=True)
     is_superuser = Column(Boolean, default=False)
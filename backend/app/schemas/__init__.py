@@ -4,7 +4,7 @@ from .user import User, UserCreate, UserInDB, UserUpdate
 from .repository import (
     Repository, RepositoryCreate, RepositoryUpdate, RepositoryInDBBase,
     Scan, ScanCreate, ScanUpdate, ScanInDBBase,
-    Finding, FindingCreate, FindingUpdate, FindingInDBBase,
+    Finding, FindingDetail, FindingCreate, FindingUpdate, FindingInDBBase,
     FindingSeverity, FindingType, ScanStatus, RepositoryWithScans, ScanWithFindings,
     RepositoryScanSummary, ScanSummary
 )
@@ -20,7 +20,7 @@ __all__ = [
     'Repository', 'RepositoryCreate', 'RepositoryUpdate', 'RepositoryInDBBase',
     'Scan', 'ScanCreate', 'ScanUpdate', 'ScanInDBBase', 'RepositoryWithScans', 'ScanWithFindings',
     'RepositoryScanSummary', 'ScanSummary',
-    'Finding', 'FindingCreate', 'FindingUpdate', 'FindingInDBBase',
+    'Finding', 'FindingDetail', 'FindingCreate', 'FindingUpdate', 'FindingInDBBase',
     'FindingSeverity', 'FindingType', 'ScanStatus',
     'Recommendation', 'RecommendationCreate', 'RecommendationUpdate', 'RecommendationInDBBase',
     'RecommendationStatus', 'RecommendationType', 'RecommendationWithRelated'
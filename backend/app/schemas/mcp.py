@@ -2,8 +2,10 @@
 MCP (Multi-Component Protocol) Schema Definitions
 
 This module contains Pydantic models for request/response validation in the MCP API.
+Hot-path payloads also have msgspec mirrors that decode JSON straight into typed structs.
 """
-from typing import Dict, Any, List, Optional, Union
+from typing import Dict, Any, List, Optional, Union, Annotated
+import msgspec
 from pydantic import BaseModel, Field, HttpUrl, validator
 from enum import Enum
 from datetime import datetime
@@ -69,6 +71,13 @@ class ToolExecutionRequest(BaseModel):
         description="Additional context about the user or request"
     )
 
+class ToolExecutionPayload(msgspec.Struct):
+    """msgspec mirror of ToolExecutionRequest, used by the tool execution endpoint."""
+    agent_id: str
+    parameters: Dict[str, Any] = {}
+    request_id: Optional[Annotated[str, msgspec.Meta(min_length=1, max_length=100)]] = None
+    user_context: Optional[Dict[str, Any]] = None
+
 class ExecutionLogFilter(BaseModel):
     """Filter parameters for querying execution logs."""
     agent_id: Optional[str] = None
@@ -95,6 +104,14 @@ class ToolExecutionStatus(str, Enum):
     FAILED = "failed"
     TIMEOUT = "timeout"
 
+class ToolExecutionResultResponse(BaseModel):
+    """Response model for the result of executing a tool."""
+    success: bool
+    result: Any = None
+    execution_time_ms: float
+    error: Optional[str] = None
+    timestamp: str
+
 class ToolExecutionResponse(BaseModel):
     """Response model for a tool execution."""
     execution_id: str
@@ -115,6 +132,10 @@ class AgentStatus(str, Enum):
     INACTIVE = "inactive"
     SUSPENDED = "suspended"
 
+class AgentStatusUpdateRequest(BaseModel):
+    """Request model for changing a registered agent's status."""
+    status: AgentStatus
+
 class AgentInfo(BaseModel):
     """Information about a registered agent."""
     agent_id: str
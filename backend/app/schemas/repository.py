@@ -34,7 +34,7 @@ class RepositoryBase(BaseModel):
     last_commit_at: Optional[datetime] = None
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 class RepositoryCreate(RepositoryBase):
     """Schema for creating a new repository."""
@@ -85,7 +85,7 @@ class ScanBase(BaseModel):
     error_message: Optional[str] = None
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 class ScanCreate(ScanBase):
     """Schema for creating a new scan."""
@@ -114,15 +114,6 @@ class Scan(ScanInDBBase):
     """Scan schema for API responses."""
     pass
 
-class ScanWithFindings(Scan):
-    """Scan schema with findings included."""
-    findings: List["Finding"] = []
-    total_findings: int = 0
-    critical_findings: int = 0
-    high_findings: int = 0
-    medium_findings: int = 0
-    low_findings: int = 0
-
 class FindingSeverity(str, Enum):
     """Severity levels for findings."""
     CRITICAL = "critical"
@@ -160,18 +151,18 @@ class FindingBase(BaseModel):
     status: FindingStatus = FindingStatus.OPEN
     file_path: Optional[str] = None
     line_number: Optional[int] = None
-    code_snippet: Optional[str] = None
     estimated_cost_savings: Optional[float] = None  # in USD
     estimated_carbon_reduction: Optional[float] = None  # in kg CO2e
-    recommended_fix: Optional[str] = None
     fix_difficulty: Optional[str] = None  # easy, medium, hard
     fix_effort: Optional[str] = None  # e.g., "1 hour", "2-4 hours"
-    metadata: Dict[str, Any] = {}
+    metadata: Dict[str, Any] = Field(default_factory=dict)
 
 class FindingCreate(FindingBase):
     """Schema for creating a new finding."""
     scan_id: int
     repository_id: int
+    code_snippet: Optional[str] = None
+    recommended_fix: Optional[str] = None
 
 class FindingUpdate(BaseModel):
     """Schema for updating a finding."""
@@ -194,11 +185,26 @@ class FindingInDBBase(FindingBase):
         orm_mode = True
 
 class Finding(FindingInDBBase):
-    """Finding schema for API responses."""
+    """Finding schema for list responses.
+    
+    The large code_snippet and recommended_fix columns are deferred on the
+    model, so they are left out here to avoid a second query per row.
+    """
     pass
 
-# Update forward references
-ScanWithFindings.update_forward_refs()
+class FindingDetail(Finding):
+    """Finding schema for single-finding responses, including the large text fields."""
+    code_snippet: Optional[str] = None
+    recommended_fix: Optional[str] = None
+
+class ScanWithFindings(Scan):
+    """Scan schema with findings included."""
+    findings: List[Finding] = Field(default_factory=list)
+    total_findings: int = 0
+    critical_findings: int = 0
+    high_findings: int = 0
+    medium_findings: int = 0
+    low_findings: int = 0
 
 class ScanSummary(BaseModel):
     """Summary of a scan with aggregated statistics."""
@@ -210,8 +216,8 @@ class ScanSummary(BaseModel):
     info_findings: int = 0
     estimated_cost_savings: float = 0.0  # in USD
     estimated_carbon_reduction: float = 0.0  # in kg CO2e
-    findings_by_type: Dict[FindingType, int] = {}
-    findings_by_severity: Dict[FindingSeverity, int] = {}
+    findings_by_type: Dict[FindingType, int] = Field(default_factory=dict)
+    findings_by_severity: Dict[FindingSeverity, int] = Field(default_factory=dict)
 
 class RepositoryScanSummary(BaseModel):
     """Summary of scans for a repository."""
@@ -224,5 +230,5 @@ class RepositoryScanSummary(BaseModel):
 
 class RepositoryWithScans(Repository):
     """Repository schema with scans included."""
-    scans: List[Scan] = []
+    scans: List[Scan] = Field(default_factory=list)
     scan_summary: Optional[ScanSummary] = None
@@ -18,11 +18,24 @@ class UserCreate(UserBase):
     def password_strength(cls, v):
         if len(v) < 8:
             raise ValueError('Password must be at least 8 characters long')
-        if not any(char.isdigit() for char in v):
+        
+        # Check all character classes in a single pass
+        has_digit = has_upper = has_lower = False
+        for char in v:
+            if char.isdigit():
+                has_digit = True
+            elif char.isupper():
+                has_upper = True
+            elif char.islower():
+                has_lower = True
+            if has_digit and has_upper and has_lower:
+                break
+        
+        if not has_digit:
             raise ValueError('Password must contain at least one number')
-        if not any(char.isupper() for char in v):
+        if not has_upper:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not any(char.islower() for char in v):
+        if not has_lower:
             raise ValueError('Password must contain at least one lowercase letter')
         return v
 
@@ -1,12 +1,49 @@
 import logging
-from typing import Dict, List, Optional, Union
+import re
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
-import math
 
 from ..config import settings
 
 logger = logging.getLogger(__name__)
 
+# Watt-seconds in one kilowatt-hour
+WATT_SECONDS_PER_KWH = 3600 * 1000
+
+# CPU utilization assumed for workflow jobs
+JOB_CPU_USAGE = 0.8
+
+# Runner label fragments that identify a hosted machine type
+RUNNER_OS_NAMES = ("ubuntu", "windows", "macos")
+
+# Matches the step ID in "${{ steps.<id>.outputs... }}" expressions
+STEP_OUTPUT_REF = re.compile(r"steps\.([A-Za-z0-9_-]+)\.outputs")
+
+# Job names suggesting a Windows runner is actually required
+WINDOWS_JOB_NAME = re.compile(r"win|\.net|c#|csharp", re.IGNORECASE)
+
+@lru_cache(maxsize=64)
+def _classify_machine_type(machine_type: str) -> Tuple[bool, bool]:
+    """Return (is_large, is_windows) for a runner machine type."""
+    machine_type = machine_type.lower()
+    return "large" in machine_type, "windows" in machine_type
+
+def _intern(value: Any) -> Any:
+    """Intern a string field from an API payload, passing other values (e.g. None) through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+if sys.version_info >= (3, 11):
+    # fromisoformat accepts the trailing "Z" GitHub uses from 3.11 on
+    parse_timestamp = datetime.fromisoformat
+else:
+    def parse_timestamp(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp as returned by the GitHub API."""
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
 class CarbonCalculator:
     """Service for calculating carbon emissions from CI/CD workflows."""
     
@@ -28,6 +65,9 @@ class CarbonCalculator:
         "2xlarge": 128.0,          # 32-core VM
     }
     
+    # Power consumption assumed for unknown machine types
+    DEFAULT_POWER_CONSUMPTION = MACHINE_POWER_CONSUMPTION["ubuntu-latest"]
+    
     # Default carbon intensity in kg CO2e per kWh
     # Source: https://www.iea.org/reports/global-energy-co2-status-report-2019/emissions
     DEFAULT_CARBON_INTENSITY = 0.5  # Global average
@@ -69,38 +109,47 @@ class CarbonCalculator:
             - emissions_kg: Carbon emissions in kg CO2e
             - energy_kwh: Energy consumption in kWh
             - estimated_cost: Estimated cost in USD
+            Values are unrounded; totals are rounded once when reported.
         """
-        # Get power consumption for the machine type
-        power_watts = self.MACHINE_POWER_CONSUMPTION.get(
-            machine_type.lower(),
-            self.MACHINE_POWER_CONSUMPTION["ubuntu-latest"]
-        )
-        
-        # Adjust for CPU utilization
-        adjusted_power = power_watts * cpu_usage
-        
-        # Convert duration to hours
-        duration_hours = duration_seconds / 3600
-        
-        # Calculate energy consumption in kWh
-        energy_kwh = (adjusted_power * duration_hours) / 1000
-        
-        # Calculate carbon emissions
-        emissions_kg = energy_kwh * self.carbon_intensity
-        
-        # Calculate estimated cost
-        estimated_cost = energy_kwh * self.cost_per_kwh
+        energy_kwh, emissions_kg, estimated_cost = self._footprint(machine_type, cpu_usage, duration_seconds)
         
         return {
-            "emissions_kg": round(emissions_kg, 6),  # 1g precision
-            "energy_kwh": round(energy_kwh, 6),
-            "estimated_cost": round(estimated_cost, 4),
+            "emissions_kg": emissions_kg,
+            "energy_kwh": energy_kwh,
+            "estimated_cost": estimated_cost,
             "machine_type": machine_type,
             "duration_seconds": duration_seconds,
             "carbon_intensity": self.carbon_intensity,
             "cost_per_kwh": self.cost_per_kwh
         }
     
+    def _footprint(
+        self,
+        machine_type: str,
+        cpu_usage: float,
+        duration_seconds: float
+    ) -> Tuple[float, float, float]:
+        """Calculate energy, emissions and cost for running a machine.
+        
+        Returns:
+            Tuple of energy in kWh, emissions in kg CO2e and cost in USD.
+        """
+        # Energy in kWh: watts adjusted for CPU utilization, times seconds,
+        # folded into a single division (3600 s/h * 1000 W/kW)
+        energy_kwh = self._get_power_watts(machine_type) * cpu_usage * duration_seconds / WATT_SECONDS_PER_KWH
+        return energy_kwh, energy_kwh * self.carbon_intensity, energy_kwh * self.cost_per_kwh
+    
+    def _get_power_watts(self, machine_type: str) -> float:
+        """Get the power consumption in watts for a machine type."""
+        # Keys are lowercase, so only lowercase the argument on a miss
+        power_watts = self.MACHINE_POWER_CONSUMPTION.get(machine_type)
+        if power_watts is None:
+            power_watts = self.MACHINE_POWER_CONSUMPTION.get(
+                machine_type.lower(),
+                self.DEFAULT_POWER_CONSUMPTION
+            )
+        return power_watts
+    
     def analyze_workflow_run(
         self, 
         workflow_data: Dict[str, Any],
@@ -115,48 +164,54 @@ class CarbonCalculator:
         Returns:
             Dictionary with analysis results.
         """
-        total_emissions = 0.0
+        # Emissions and cost are linear in energy, so only energy is
+        # accumulated per job and the other totals are derived once
         total_energy = 0.0
-        total_cost = 0.0
         
         job_analyses = []
         
         for job in job_data:
             # Get job duration in seconds
-            started_at = datetime.fromisoformat(job["started_at"].replace("Z", "+00:00"))
-            completed_at = datetime.fromisoformat(job["completed_at"].replace("Z", "+00:00"))
+            started_at = parse_timestamp(job["started_at"])
+            completed_at = parse_timestamp(job["completed_at"])
             duration_seconds = (completed_at - started_at).total_seconds()
             
-            # Get machine type from runner name or labels
-            runner_name = job.get("runner_name", "")
+            # Get machine type from runner labels
             runner_labels = job.get("labels", [])
             
             # Try to determine machine type from labels
             machine_type = "ubuntu-latest"  # Default
             for label in runner_labels:
-                if any(os in label.lower() for os in ["ubuntu", "windows", "macos"]):
-                    machine_type = label
+                label_lower = label.lower()
+                if any(os in label_lower for os in RUNNER_OS_NAMES):
+                    # Labels come from a small set; interning lets every job
+                    # share one string object per machine type
+                    machine_type = sys.intern(label)
                     break
             
-            # Calculate emissions for this job
-            job_result = self.calculate_emissions(
-                duration_seconds=duration_seconds,
-                machine_type=machine_type,
-                cpu_usage=0.8  # Default assumption of 80% CPU usage
+            # Calculate emissions for this job, assuming 80% CPU usage. The shared
+            # helper is used instead of calculate_emissions so each job builds a single dict.
+            energy_kwh, emissions_kg, estimated_cost = self._footprint(
+                machine_type, JOB_CPU_USAGE, duration_seconds
             )
-            
-            total_emissions += job_result["emissions_kg"]
-            total_energy += job_result["energy_kwh"]
-            total_cost += job_result["estimated_cost"]
+            total_energy += energy_kwh
             
             job_analyses.append({
                 "job_id": job["id"],
                 "job_name": job["name"],
+                "started_at": job["started_at"],
                 "duration_seconds": duration_seconds,
                 "machine_type": machine_type,
-                **job_result
+                "emissions_kg": emissions_kg,
+                "energy_kwh": energy_kwh,
+                "estimated_cost": estimated_cost,
+                "carbon_intensity": self.carbon_intensity,
+                "cost_per_kwh": self.cost_per_kwh
             })
         
+        total_emissions = total_energy * self.carbon_intensity
+        total_cost = total_energy * self.cost_per_kwh
+        
         # Calculate potential savings
         potential_savings = self.calculate_potential_savings(job_analyses)
         
@@ -165,8 +220,8 @@ class CarbonCalculator:
             "workflow_name": workflow_data["name"],
             "run_id": workflow_data["run_id"],
             "run_number": workflow_data["run_number"],
-            "event": workflow_data["event"],
-            "status": workflow_data["status"],
+            "event": _intern(workflow_data["event"]),
+            "status": _intern(workflow_data["status"]),
             "conclusion": workflow_data.get("conclusion"),
             "created_at": workflow_data["created_at"],
             "updated_at": workflow_data["updated_at"],
@@ -190,18 +245,40 @@ class CarbonCalculator:
         Returns:
             Dictionary with potential savings information.
         """
-        total_current_emissions = sum(job["emissions_kg"] for job in job_analyses)
-        total_current_cost = sum(job["estimated_cost"] for job in job_analyses)
+        total_current_emissions = 0.0
+        total_current_cost = 0.0
+        cache_candidates = []
+        machine_candidates = []
+        
+        # Single pass: accumulate totals and collect candidates for the
+        # caching and machine type analyses
+        for job in job_analyses:
+            total_current_emissions += job["emissions_kg"]
+            total_current_cost += job["estimated_cost"]
+            
+            # Long jobs could benefit from caching
+            if job["duration_seconds"] > 120:  # Jobs longer than 2 minutes
+                cache_candidates.append(job)
+            
+            # Jobs that might be using more resources than needed
+            is_large, is_windows = _classify_machine_type(job["machine_type"])
+            
+            # Check if this is a large machine that might be underutilized
+            if is_large and job["duration_seconds"] < 300:  # Less than 5 minutes
+                machine_candidates.append(job)
+            # Check for Windows runners when Linux could be used
+            elif is_windows and not WINDOWS_JOB_NAME.search(job.get("job_name", "")):
+                machine_candidates.append(job)
         
         opportunities = []
         
         # 1. Caching opportunity analysis
-        cache_opportunity = self._analyze_caching_opportunity(job_analyses)
+        cache_opportunity = self._analyze_caching_opportunity(cache_candidates)
         if cache_opportunity:
             opportunities.append(cache_opportunity)
         
         # 2. Machine type optimization
-        machine_opportunity = self._analyze_machine_optimization(job_analyses)
+        machine_opportunity = self._analyze_machine_optimization(machine_candidates)
         if machine_opportunity:
             opportunities.append(machine_opportunity)
         
@@ -224,19 +301,15 @@ class CarbonCalculator:
     
     def _analyze_caching_opportunity(
         self, 
-        job_analyses: List[Dict[str, Any]]
+        cache_candidates: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
-        """Analyze potential caching opportunities."""
+        """Analyze potential caching opportunities.
+        
+        Args:
+            cache_candidates: Jobs long enough to benefit from caching.
+        """
         # This is a simplified analysis - in a real implementation, you'd analyze
         # the actual workflow files to detect caching opportunities
-        
-        # Look for jobs that take a long time but could benefit from caching
-        cache_candidates = []
-        
-        for job in job_analyses:
-            if job["duration_seconds"] > 120:  # Jobs longer than 2 minutes
-                cache_candidates.append(job)
-        
         if not cache_candidates:
             return None
         
@@ -247,11 +320,11 @@ class CarbonCalculator:
         total_savings_cost = 0.0
         
         for job in cache_candidates:
-            savings_emissions = job["emissions_kg"] * avg_savings_pct
-            savings_cost = job["estimated_cost"] * avg_savings_pct
-            
-            total_savings_emissions += savings_emissions
-            total_savings_cost += savings_cost
+            total_savings_emissions += job["emissions_kg"]
+            total_savings_cost += job["estimated_cost"]
+        
+        total_savings_emissions *= avg_savings_pct
+        total_savings_cost *= avg_savings_pct
         
         return {
             "type": "caching",
@@ -265,25 +338,13 @@ class CarbonCalculator:
     
     def _analyze_machine_optimization(
         self, 
-        job_analyses: List[Dict[str, Any]]
+        optimization_candidates: List[Dict[str, Any]]
     ) -> Optional[Dict[str, Any]]:
-        """Analyze potential machine type optimizations."""
-        # Look for jobs that might be using more resources than needed
-        optimization_candidates = []
-        
-        for job in job_analyses:
-            machine_type = job["machine_type"].lower()
-            
-            # Check if this is a large machine that might be underutilized
-            if "large" in machine_type and job["duration_seconds"] < 300:  # Less than 5 minutes
-                optimization_candidates.append(job)
-            # Check for Windows runners when Linux could be used
-            elif "windows" in machine_type and not any(
-                ext in job.get("job_name", "").lower() 
-                for ext in ["windows", "win", ".net", "c#", "csharp"]
-            ):
-                optimization_candidates.append(job)
+        """Analyze potential machine type optimizations.
         
+        Args:
+            optimization_candidates: Jobs whose machine type looks oversized.
+        """
         if not optimization_candidates:
             return None
         
@@ -294,11 +355,11 @@ class CarbonCalculator:
         total_savings_cost = 0.0
         
         for job in optimization_candidates:
-            savings_emissions = job["emissions_kg"] * avg_savings_pct
-            savings_cost = job["estimated_cost"] * avg_savings_pct
-            
-            total_savings_emissions += savings_emissions
-            total_savings_cost += savings_cost
+            total_savings_emissions += job["emissions_kg"]
+            total_savings_cost += job["estimated_cost"]
+        
+        total_savings_emissions *= avg_savings_pct
+        total_savings_cost *= avg_savings_pct
         
         return {
             "type": "machine_optimization",
@@ -325,22 +386,38 @@ class CarbonCalculator:
         # Simple check: if jobs are running sequentially but don't depend on each other
         sequential_jobs = []
         
+        # Parse each start time once up front rather than per adjacent pair
+        starts = [
+            parse_timestamp(job["started_at"]) if isinstance(job.get("started_at"), str)
+            else job.get("started_at")
+            for job in job_analyses
+        ]
+        
+        # Collect each job's step IDs once instead of per pair
+        job_step_ids = [
+            {step["id"] for step in job.get("steps", []) if "id" in step}
+            for job in job_analyses
+        ]
+        
         for i in range(len(job_analyses) - 1):
             current_job = job_analyses[i]
             next_job = job_analyses[i + 1]
             
-            # If jobs overlap in time, they're already running in parallel
-            current_end = current_job.get("started_at", "") + timedelta(seconds=current_job["duration_seconds"])
-            next_start = next_job.get("started_at", "")
+            if starts[i] is None or starts[i + 1] is None:
+                continue
             
-            if isinstance(current_end, str):
-                current_end = datetime.fromisoformat(current_end.replace("Z", "+00:00"))
-            if isinstance(next_start, str):
-                next_start = datetime.fromisoformat(next_start.replace("Z", "+00:00"))
+            # Savings are estimated from per-second rates, which zero-duration
+            # (e.g. skipped) jobs don't have
+            if current_job["duration_seconds"] <= 0 or next_job["duration_seconds"] <= 0:
+                continue
+            
+            # If jobs overlap in time, they're already running in parallel
+            current_end = starts[i] + timedelta(seconds=current_job["duration_seconds"])
+            next_start = starts[i + 1]
             
             if next_start >= current_end:
                 # Jobs are sequential, check if they could run in parallel
-                if not self._jobs_have_dependency(current_job, next_job):
+                if not self._jobs_have_dependency(job_step_ids[i], next_job):
                     sequential_jobs.append((current_job, next_job))
         
         if not sequential_jobs:
@@ -378,19 +455,20 @@ class CarbonCalculator:
     
     def _jobs_have_dependency(
         self, 
-        job1: Dict[str, Any], 
+        job1_step_ids: Set[str], 
         job2: Dict[str, Any]
     ) -> bool:
-        """Check if there's a dependency between two jobs."""
+        """Check if job2 references the outputs of any of job1's steps."""
         # This is a simplified check - in a real implementation, you'd parse
         # the workflow file to determine actual dependencies
-        
-        # Check if job2 depends on job1's outputs
-        job1_outputs = [f"${{{{ steps.{step}.outputs }}}}" for step in job1.get("steps", [])]
+        if not job1_step_ids:
+            return False
         
         for step in job2.get("steps", []):
-            for output in job1_outputs:
-                if output in step.get("with", {}) or output in step.get("env", {}):
+            # Output references appear in the values of with/env, e.g.
+            # "${{ steps.build.outputs.version }}"
+            for value in (*step.get("with", {}).values(), *step.get("env", {}).values()):
+                if isinstance(value, str) and not job1_step_ids.isdisjoint(STEP_OUTPUT_REF.findall(value)):
                     return True
         
         return False
@@ -1,17 +1,42 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional, Any
+import re
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Any, Tuple
+import httpx
+from sqlalchemy import func, select, update
+from sqlalchemy.exc import IntegrityError
 from github import Github, GithubIntegration, Auth
 from github.Repository import Repository as GithubRepository
-from github.Workflow import Workflow
-from github.WorkflowRun import WorkflowRun
 from github.PullRequest import PullRequest as GithubPullRequest
 
 from ..config import settings
-from ..models.repository import Repository, RepositoryScan, ScanFinding, ScanFindingType, ScanFindingSeverity
+from ..models.repository import Repository, RepositoryScan, ScanFinding, ScanFindingType, ScanFindingSeverity, WorkflowAnalysisCache
 from ..database import get_db_session
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Workflows analyzed concurrently per scan, to stay within GitHub's rate limits
+MAX_CONCURRENT_WORKFLOW_ANALYSES = 10
+
+# Only runs created within this window are considered when analyzing a workflow
+WORKFLOW_RUNS_LOOKBACK_DAYS = 30
+
+# Markers the workflow checks look for, found in a single scan of the file
+WORKFLOW_MARKERS = re.compile(rb"actions/cache@|schedule:|\* \* \* \* \*")
+
+# Workflow file contents keyed by (owner, repo, path, ETag), least recently used first.
+# The ETag changes with the file, so new commits never hit a stale entry.
+WORKFLOW_CONTENT_CACHE_SIZE = 4096
+_workflow_contents: "OrderedDict[Tuple[str, str, str, str], bytes]" = OrderedDict()
+
+def clear_workflow_content_cache() -> None:
+    """Drop all cached workflow file contents."""
+    _workflow_contents.clear()
+
 class GitHubService:
     """Service for interacting with the GitHub API."""
     
@@ -24,11 +49,13 @@ class GitHubService:
         """
         self.access_token = access_token
         self.github = self._get_github_client()
+        self._http: Optional[httpx.AsyncClient] = None
     
     def _get_github_client(self):
         """Get a GitHub client instance."""
         if self.access_token:
-            return Github(self.access_token)
+            # Fetch the maximum page size so list endpoints need fewer requests
+            return Github(self.access_token, per_page=100)
         
         # Use GitHub App credentials if no access token is provided
         if not settings.GITHUB_APP_ID or not settings.GITHUB_APP_PRIVATE_KEY:
@@ -48,30 +75,179 @@ class GitHubService:
         """Get a GitHub repository."""
         return self.github.get_repo(f"{owner}/{repo_name}")
     
-    def get_workflows(self, owner: str, repo_name: str) -> List[Workflow]:
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Lazy-load the async client used for GitHub REST calls."""
+        if self._http is None:
+            if not self.access_token:
+                raise ValueError("An access token is required for GitHub REST calls")
+            self._http = httpx.AsyncClient(
+                base_url=GITHUB_API_URL,
+                headers={
+                    "Authorization": f"Bearer {self.access_token}",
+                    "Accept": "application/vnd.github+json"
+                },
+                timeout=30.0
+            )
+        return self._http
+    
+    async def close(self) -> None:
+        """Close the underlying HTTP client."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def _api_get(self, path: str, **params: Any) -> Any:
+        """GET a GitHub REST endpoint and return the decoded JSON body."""
+        response = await self.http.get(path, params=params or None)
+        response.raise_for_status()
+        return response.json()
+    
+    async def _conditional_get(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        raw: bool = False,
+        **params: Any
+    ) -> Tuple[Any, Optional[str]]:
+        """GET a GitHub REST endpoint with If-None-Match.
+        
+        A 304 response does not count against the rate limit.
+        
+        Args:
+            path: API path to request
+            etag: ETag of the previously fetched response, if any
+            raw: Request the raw file media type and return the body as bytes
+            
+        Returns:
+            Tuple of the body (None if not modified) and the current ETag.
+        """
+        headers = {"Accept": "application/vnd.github.raw"} if raw else {}
+        if etag:
+            headers["If-None-Match"] = etag
+        response = await self.http.get(path, params=params or None, headers=headers)
+        if response.status_code == 304:
+            return None, etag
+        response.raise_for_status()
+        return (response.content if raw else response.json()), response.headers.get("ETag")
+    
+    async def get_workflows(self, owner: str, repo_name: str) -> List[Dict[str, Any]]:
         """Get all workflows for a repository."""
-        repo = self.get_repository(owner, repo_name)
-        return list(repo.get_workflows())
+        data = await self._api_get(f"/repos/{owner}/{repo_name}/actions/workflows", per_page=100)
+        return data["workflows"]
     
-    def get_workflow_runs(self, owner: str, repo_name: str, workflow_id: Optional[int] = None) -> List[WorkflowRun]:
+    async def get_workflow_runs(self, owner: str, repo_name: str, workflow_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get workflow runs for a repository or a specific workflow."""
-        repo = self.get_repository(owner, repo_name)
         if workflow_id:
-            workflow = repo.get_workflow(workflow_id)
-            return list(workflow.get_runs())
-        return list(repo.get_workflow_runs())
+            path = f"/repos/{owner}/{repo_name}/actions/workflows/{workflow_id}/runs"
+        else:
+            path = f"/repos/{owner}/{repo_name}/actions/runs"
+        data = await self._api_get(path, per_page=100)
+        return data["workflow_runs"]
     
-    def analyze_workflow(self, owner: str, repo_name: str, workflow_path: str) -> Dict[str, Any]:
-        """Analyze a GitHub Actions workflow for potential optimizations."""
-        repo = self.get_repository(owner, repo_name)
-        workflow = repo.get_workflow(workflow_path)
-        runs = workflow.get_runs()
+    async def analyze_workflow(
+        self,
+        owner: str,
+        repo_name: str,
+        workflow_path: str,
+        db: Any = None,
+        workflow_name: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Analyze a GitHub Actions workflow for potential optimizations.
+        
+        When a database session is given, the previous analysis is reused if
+        neither the workflow file nor its runs have changed since. Passing the
+        workflow name (known from the workflows listing) saves a request.
+        """
+        cached = None
+        if db is not None:
+            cached = db.query(WorkflowAnalysisCache).filter(
+                WorkflowAnalysisCache.owner == owner,
+                WorkflowAnalysisCache.repo == repo_name,
+                WorkflowAnalysisCache.path == workflow_path
+            ).first()
+        
+        analysis, contents_etag, runs_etag, modified = await self._fetch_workflow_analysis(
+            owner, repo_name, workflow_path, cached, workflow_name
+        )
+        if db is not None and modified:
+            self._store_workflow_analysis(db, cached, owner, repo_name, workflow_path, analysis, contents_etag, runs_etag)
+            db.commit()
+        
+        return analysis
+    
+    async def _fetch_workflow_analysis(
+        self,
+        owner: str,
+        repo_name: str,
+        workflow_path: str,
+        cached: Optional[WorkflowAnalysisCache] = None,
+        workflow_name: Optional[str] = None
+    ) -> Tuple[Dict[str, Any], Optional[str], Optional[str], bool]:
+        """Fetch a workflow and its recent runs from GitHub and analyze them.
+        
+        Only makes HTTP calls; the database session is never touched here, so
+        several of these can safely run concurrently.
+        
+        Args:
+            owner: Repository owner
+            repo_name: Repository name
+            workflow_path: Path of the workflow file in the repository
+            cached: Previously cached analysis whose ETags are sent with the requests
+            workflow_name: Workflow display name; fetched from GitHub if not given
+            
+        Returns:
+            Tuple of the analysis, the contents and runs ETags, and whether anything
+            changed. When nothing changed, the cached analysis is returned as is.
+        """
+        repo_path = f"/repos/{owner}/{repo_name}"
+        # The workflow endpoints accept the workflow file name in place of its ID
+        workflow_file = workflow_path.rsplit("/", 1)[-1]
+        contents_path = f"{repo_path}/contents/{workflow_path}"
+        runs_path = f"{repo_path}/actions/workflows/{workflow_file}/runs"
+        # Day granularity keeps the query, and so the runs ETag, stable within a day
+        since = (datetime.now(timezone.utc) - timedelta(days=WORKFLOW_RUNS_LOOKBACK_DAYS)).date().isoformat()
+        runs_params = {"per_page": 10, "status": "completed", "created": f">={since}"}
+        
+        (workflow_content, contents_etag), (runs_data, runs_etag) = await asyncio.gather(
+            self._conditional_get(contents_path, cached.contents_etag if cached else None, raw=True),
+            self._conditional_get(runs_path, cached.runs_etag if cached else None, **runs_params)
+        )
+        if cached is not None and workflow_content is None and runs_data is None:
+            return cached.analysis, contents_etag, runs_etag, False
+        
+        # Only one side changed; fetch the other in full unless the file is already in memory
+        if workflow_content is None:
+            workflow_content = _workflow_contents.get((owner, repo_name, workflow_path, contents_etag))
+        if workflow_content is None:
+            workflow_content, contents_etag = await self._conditional_get(contents_path, raw=True)
+        if contents_etag:
+            content_key = (owner, repo_name, workflow_path, contents_etag)
+            _workflow_contents[content_key] = workflow_content
+            _workflow_contents.move_to_end(content_key)
+            if len(_workflow_contents) > WORKFLOW_CONTENT_CACHE_SIZE:
+                _workflow_contents.popitem(last=False)
+        if runs_data is None:
+            runs_data, runs_etag = await self._conditional_get(runs_path, **runs_params)
+        
+        if workflow_name is None:
+            workflow = await self._api_get(f"{repo_path}/actions/workflows/{workflow_file}")
+            workflow_name = workflow["name"]
         
         # Get the most recent runs for analysis
-        recent_runs = list(runs[:10])  # Analyze last 10 runs
+        recent_runs = runs_data["workflow_runs"][:10]  # Analyze last 10 runs
         
-        # Calculate metrics
-        total_duration = sum(run.timing() for run in recent_runs if run.timing() is not None)
+        # Durations come from the listing itself, so no per-run /timing requests are needed
+        total_duration = 0.0
+        successes = 0
+        for run in recent_runs:
+            started_at = run.get("run_started_at") or run["created_at"]
+            total_duration += (
+                datetime.fromisoformat(run["updated_at"].replace("Z", "+00:00"))
+                - datetime.fromisoformat(started_at.replace("Z", "+00:00"))
+            ).total_seconds()
+            if run["conclusion"] == "success":
+                successes += 1
         avg_duration = total_duration / len(recent_runs) if recent_runs else 0
         
         # Check for common issues
@@ -87,8 +263,8 @@ class GitHubService:
             })
         
         # 2. Check for cache usage
-        workflow_content = repo.get_contents(workflow_path).decoded_content.decode()
-        if "actions/cache@" not in workflow_content:
+        markers = {match.group() for match in WORKFLOW_MARKERS.finditer(workflow_content)}
+        if b"actions/cache@" not in markers:
             issues.append({
                 "type": "MISSING_CACHE",
                 "severity": "high",
@@ -97,10 +273,10 @@ class GitHubService:
             })
         
         # 3. Check for scheduled runs frequency
-        if "schedule:" in workflow_content:
+        if b"schedule:" in markers:
             # Parse schedule to check for frequent runs
             # This is a simplified check - a real implementation would parse the cron expression
-            if "* * * * *" in workflow_content:  # Every minute
+            if b"* * * * *" in markers:  # Every minute
                 issues.append({
                     "type": "FREQUENT_SCHEDULE",
                     "severity": "high",
@@ -108,48 +284,131 @@ class GitHubService:
                     "suggestion": "Consider if such frequent runs are necessary. Reduce frequency if possible."
                 })
         
-        return {
-            "workflow_name": workflow.name,
+        analysis = {
+            "workflow_name": workflow_name,
             "path": workflow_path,
             "total_runs_analyzed": len(recent_runs),
             "average_duration_seconds": avg_duration,
-            "success_rate": sum(1 for r in recent_runs if r.conclusion == "success") / len(recent_runs) if recent_runs else 0,
+            "success_rate": successes / len(recent_runs) if recent_runs else 0,
             "issues": issues
         }
+        
+        return analysis, contents_etag, runs_etag, True
+    
+    def _store_workflow_analysis(
+        self,
+        db: Any,
+        cached: Optional[WorkflowAnalysisCache],
+        owner: str,
+        repo_name: str,
+        workflow_path: str,
+        analysis: Dict[str, Any],
+        contents_etag: Optional[str],
+        runs_etag: Optional[str]
+    ) -> None:
+        """Save a workflow analysis and its ETags in the session without committing."""
+        if cached is not None:
+            cached.contents_etag = contents_etag
+            cached.runs_etag = runs_etag
+            cached.analysis = analysis
+            return
+        
+        try:
+            # A savepoint keeps a losing insert from poisoning the caller's transaction
+            with db.begin_nested():
+                db.add(WorkflowAnalysisCache(
+                    owner=owner,
+                    repo=repo_name,
+                    path=workflow_path,
+                    contents_etag=contents_etag,
+                    runs_etag=runs_etag,
+                    analysis=analysis
+                ))
+        except IntegrityError:
+            # A concurrent scan cached this workflow first; its entry is just as fresh
+            logger.info(f"Workflow analysis for {owner}/{repo_name}/{workflow_path} already cached")
     
-    def create_scan_findings(self, db: Any, scan_id: int, owner: str, repo_name: str) -> List[ScanFinding]:
+    async def create_scan_findings(self, db: Any, scan_id: int, owner: str, repo_name: str) -> List[ScanFinding]:
         """Create scan findings for a repository."""
         db = next(get_db_session()) if db is None else db
         
         try:
             # Get all workflows
-            workflows = self.get_workflows(owner, repo_name)
+            workflows = await self.get_workflows(owner, repo_name)
+            
+            # Read every cached analysis up front; the session is only used serially
+            cached_analyses = {
+                cached.path: cached
+                for cached in db.query(WorkflowAnalysisCache).filter(
+                    WorkflowAnalysisCache.owner == owner,
+                    WorkflowAnalysisCache.repo == repo_name
+                )
+            }
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_WORKFLOW_ANALYSES)
+            
+            async def analyze(workflow: Dict[str, Any]) -> Optional[Tuple[Dict[str, Any], Optional[str], Optional[str], bool]]:
+                async with semaphore:
+                    try:
+                        return await self._fetch_workflow_analysis(
+                            owner, repo_name, workflow["path"],
+                            cached_analyses.get(workflow["path"]), workflow["name"]
+                        )
+                    except Exception as e:
+                        # One failing workflow should not fail the whole scan
+                        logger.error(f"Error analyzing workflow {workflow['path']}: {str(e)}")
+                        return None
+            
+            # Fetch all workflows concurrently
+            results = await asyncio.gather(*[analyze(workflow) for workflow in workflows])
+            analyses = []
+            
+            # Update the cache serially; it is committed with the findings below
+            for workflow, result in zip(workflows, results):
+                if result is None:
+                    analyses.append(None)
+                    continue
+                analysis, contents_etag, runs_etag, modified = result
+                if modified:
+                    self._store_workflow_analysis(
+                        db, cached_analyses.get(workflow["path"]), owner, repo_name,
+                        workflow["path"], analysis, contents_etag, runs_etag
+                    )
+                analyses.append(analysis)
+            
             findings = []
             
-            for workflow in workflows:
-                # Analyze each workflow
-                analysis = self.analyze_workflow(owner, repo_name, workflow.path)
+            for workflow, analysis in zip(workflows, analyses):
+                if analysis is None:
+                    continue
+                
+                long_running_savings = self._estimate_savings(analysis)
                 
                 # Create findings for each issue
                 for issue in analysis.get("issues", []):
+                    cost_savings, carbon_reduction = (
+                        long_running_savings if issue["type"] == "LONG_RUNNING_JOBS" else (0.0, 0.0)
+                    )
                     finding = ScanFinding(
                         scan_id=scan_id,
                         finding_type=ScanFindingType.CI_OPTIMIZATION,
                         severity=ScanFindingSeverity(issue["severity"].lower()),
                         title=f"{issue['type']}: {issue['message']}",
                         description=issue.get("suggestion", ""),
-                        file_path=workflow.path,
+                        file_path=workflow["path"],
                         status="open",
-                        estimated_cost_savings=self._estimate_cost_savings(issue, analysis),
-                        estimated_carbon_reduction=self._estimate_carbon_reduction(issue, analysis),
+                        estimated_cost_savings=cost_savings,
+                        estimated_carbon_reduction=carbon_reduction,
                         recommended_fix=issue.get("suggestion", ""),
                         fix_difficulty="medium",
                         fix_effort="1-2 hours"
                     )
                     findings.append(finding)
             
-            # Add findings to database
-            db.add_all(findings)
+            # Insert all findings in one executemany batch rather than through
+            # the identity map, then refresh the scan's denormalized totals.
+            # The returned objects are not attached to the session.
+            db.bulk_save_objects(findings, return_defaults=False)
+            self._refresh_scan_totals(db, scan_id)
             db.commit()
             
             return findings
@@ -159,30 +418,50 @@ class GitHubService:
             db.rollback()
             raise
     
-    def _estimate_cost_savings(self, issue: Dict[str, Any], analysis: Dict[str, Any]) -> float:
-        """Estimate cost savings for a finding."""
-        # This is a simplified estimation - in a real implementation, you'd want to
-        # consider more factors like GitHub Actions pricing, team size, etc.
-        savings = 0.0
+    def _refresh_scan_totals(self, db: Any, scan_id: int) -> None:
+        """Recompute a scan's finding count and savings totals in a single UPDATE.
         
-        if issue["type"] == "LONG_RUNNING_JOBS" and analysis["average_duration_seconds"] > 10 * 60:
-            # Estimate $0.008 per minute for GitHub Actions
-            # If we can reduce the duration by 30%, that's the potential savings per run
-            reduction = analysis["average_duration_seconds"] * 0.3 / 60  # in minutes
-            savings = reduction * 0.008 * 30  # Assuming 30 runs per month
+        Dashboards read these columns directly, so they are aggregated once here
+        after the findings are written instead of on every read.
+        """
+        totals = (
+            select(
+                ScanFinding.scan_id,
+                func.count(ScanFinding.id).label("total"),
+                func.coalesce(func.sum(ScanFinding.estimated_cost_savings), 0.0).label("cost"),
+                func.coalesce(func.sum(ScanFinding.estimated_carbon_reduction), 0.0).label("carbon"),
+            )
+            .where(ScanFinding.scan_id == scan_id)
+            .group_by(ScanFinding.scan_id)
+            .subquery()
+        )
         
-        return round(savings, 2)
+        db.execute(
+            update(RepositoryScan)
+            .where(RepositoryScan.id == totals.c.scan_id)
+            .values(
+                total_issues_found=totals.c.total,
+                estimated_cost_savings=totals.c.cost,
+                estimated_carbon_reduction=totals.c.carbon,
+            )
+            .execution_options(synchronize_session=False)
+        )
     
-    def _estimate_carbon_reduction(self, issue: Dict[str, Any], analysis: Dict[str, Any]) -> float:
-        """Estimate carbon reduction for a finding."""
-        # This is a simplified estimation - in a real implementation, you'd want to
-        # consider more factors like energy source, data center location, etc.
-        reduction = 0.0
+    def _estimate_savings(self, analysis: Dict[str, Any]) -> Tuple[float, float]:
+        """Estimate the monthly cost savings and carbon reduction of shortening a workflow.
         
-        if issue["type"] == "LONG_RUNNING_JOBS" and analysis["average_duration_seconds"] > 10 * 60:
-            # Estimate 0.0005 kg CO2e per minute of compute time
-            # If we can reduce the duration by 30%, that's the potential reduction per run
-            reduction_seconds = analysis["average_duration_seconds"] * 0.3
-            reduction = reduction_seconds / 60 * 0.0005 * 30  # kg CO2e per month (30 runs)
+        Only long-running workflows yield savings, and the estimate depends on the
+        workflow alone, so it is computed once per analysis rather than per issue.
+        
+        Returns:
+            Tuple of (cost savings in USD, carbon reduction in kg CO2e) per month.
+        """
+        # This is a simplified estimation - in a real implementation, you'd want to
+        # consider more factors like GitHub Actions pricing, energy source, etc.
+        if analysis["average_duration_seconds"] <= 10 * 60:
+            return 0.0, 0.0
         
-        return round(reduction, 4)
+        # If we can reduce the duration by 30%, that's the potential saving per run
+        reduction_minutes = analysis["average_duration_seconds"] * 0.3 / 60
+        # Estimate $0.008 and 0.0005 kg CO2e per minute, assuming 30 runs per month
+        return round(reduction_minutes * 0.008 * 30, 2), round(reduction_minutes * 0.0005 * 30, 4)
@@ -4,25 +4,59 @@ MCP (Multi-Component Protocol) Server for Agentic APIs
 This module implements a production-ready MCP server that enables secure,
 scalable communication between AI agents and external services.
 """
-from typing import Dict, List, Any, Optional, Callable, Awaitable
+from typing import Deque, Dict, List, Any, Optional, Callable, Awaitable, Tuple
+from collections import deque
 import logging
+import msgspec
 from fastapi import HTTPException, status
 from pydantic import BaseModel, Field
 from datetime import datetime, timezone
-import json
 import hashlib
+import orjson
+import secrets
+import threading
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class ToolExecutionResult(BaseModel):
-    """Result of a tool execution."""
+# Number of recent executions kept in memory
+EXECUTION_LOG_SIZE = 1000
+
+# JSON schema types mapped to the Python types accepted for them
+JSON_SCHEMA_TYPES: Dict[str, Any] = {
+    "string": str,
+    "number": (int, float),
+    "integer": int,
+    "boolean": bool,
+    "array": list,
+    "object": dict
+}
+
+# Second and its formatted ISO timestamp, reused until the second changes
+_timestamp_cache: Tuple[int, str] = (0, "")
+
+def _iso_now() -> str:
+    """Current UTC time as an ISO 8601 string at second resolution."""
+    global _timestamp_cache
+    second = time.time_ns() // 1_000_000_000
+    if second != _timestamp_cache[0]:
+        _timestamp_cache = (second, datetime.fromtimestamp(second, tz=timezone.utc).isoformat())
+    return _timestamp_cache[1]
+
+class ToolExecutionResult(msgspec.Struct):
+    """Result of a tool execution.
+    
+    One is built for every execution, so this is a slotted msgspec struct
+    rather than a Pydantic model; the API documents it with
+    ToolExecutionResultResponse.
+    """
     success: bool
     result: Any
-    error: Optional[str] = None
     execution_time_ms: float
-    timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+    error: Optional[str] = None
+    timestamp: str = msgspec.field(default_factory=_iso_now)
 
 class ToolDefinition(BaseModel):
     """Definition of a tool that can be executed by agents."""
@@ -54,8 +88,12 @@ class MCPServer:
     
     def __init__(self):
         self.agents: Dict[str, RegisteredAgent] = {}
+        # Guards agent registration and status changes together with the active
+        # agent count, which may be updated from threadpool workers
+        self._agents_lock = threading.Lock()
         self.tools: Dict[str, tuple[ToolDefinition, Callable[..., Awaitable[Any]]]] = {}
-        self.execution_log: List[Dict[str, Any]] = []
+        self._validators: Dict[str, Callable[[Dict[str, Any]], None]] = {}
+        self.execution_log: Deque[Dict[str, Any]] = deque(maxlen=EXECUTION_LOG_SIZE)
         self.metrics = {
             "total_requests": 0,
             "successful_executions": 0,
@@ -79,12 +117,27 @@ class MCPServer:
             metadata=metadata or {}
         )
         
-        self.agents[agent_id] = agent
-        self.metrics["active_agents"] = len([a for a in self.agents.values() if a.status == "active"])
+        with self._agents_lock:
+            previous = self.agents.get(agent_id)
+            if previous is None or previous.status != "active":
+                self.metrics["active_agents"] += 1
+            self.agents[agent_id] = agent
         
         logger.info(f"Registered agent: {agent_id} with capabilities: {capabilities}")
         return agent
     
+    def set_agent_status(self, agent_id: str, status: str) -> RegisteredAgent:
+        """Change an agent's status, keeping the active agent count in step."""
+        agent = self.agents.get(agent_id)
+        if agent is None:
+            raise ValueError(f"Agent {agent_id} is not registered")
+        
+        with self._agents_lock:
+            was_active = agent.status == "active"
+            agent.status = status
+            self.metrics["active_agents"] += (status == "active") - was_active
+        return agent
+    
     def register_tool(
         self, 
         tool_definition: Dict[str, Any], 
@@ -93,7 +146,10 @@ class MCPServer:
         """Register a new tool with the MCP server."""
         try:
             tool_def = ToolDefinition(**tool_definition)
+            # Build the validator first so a failure leaves nothing half-registered
+            validator = self._build_validator(tool_def)
             self.tools[tool_def.name] = (tool_def, handler)
+            self._validators[tool_def.name] = validator
             logger.info(f"Registered tool: {tool_def.name}")
         except Exception as e:
             logger.error(f"Failed to register tool: {str(e)}")
@@ -125,38 +181,43 @@ class MCPServer:
         """
         self.metrics["total_requests"] += 1
         execution_id = request_id or self._generate_request_id()
-        start_time = datetime.now(timezone.utc)
+        start_ns = time.monotonic_ns()
+        # Only a fingerprint of the parameters is logged on success
+        fingerprint = self._fingerprint_parameters(parameters)
         
         try:
             # Validate agent
             agent = self.agents.get(agent_id)
-            if not agent or agent.status != "active":
+            if agent is None or agent.status != "active":
                 raise HTTPException(
                     status_code=status.HTTP_403_FORBIDDEN,
                     detail=f"Agent {agent_id} is not registered or inactive"
                 )
             
             # Update last seen
-            agent.last_seen = datetime.now(timezone.utc).isoformat()
+            agent.last_seen = _iso_now()
             
             # Get tool definition and handler
-            if tool_name not in self.tools:
+            entry = self.tools.get(tool_name)
+            if entry is None:
                 raise HTTPException(
                     status_code=status.HTTP_404_NOT_FOUND,
                     detail=f"Tool '{tool_name}' not found"
                 )
                 
-            tool_def, handler = self.tools[tool_name]
+            handler = entry[1]
             
             # Validate parameters
-            self._validate_parameters(tool_def, parameters)
+            self._validators[tool_name](parameters)
             
             # Execute the tool
-            logger.info(f"Executing tool: {tool_name} with params: {parameters}")
+            logger.info(
+                f"Executing tool: {tool_name} with params hash {fingerprint[0]} ({fingerprint[1]} bytes)"
+            )
             result = await handler(**parameters, user_context=user_context or {})
             
             # Log successful execution
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            execution_time = (time.monotonic_ns() - start_ns) / 1e6
             self.metrics["successful_executions"] += 1
             
             execution_result = ToolExecutionResult(
@@ -172,7 +233,8 @@ class MCPServer:
                 parameters=parameters,
                 result=execution_result,
                 status="success",
-                execution_time_ms=execution_time
+                execution_time_ms=execution_time,
+                fingerprint=fingerprint
             )
             
             return execution_result
@@ -182,7 +244,7 @@ class MCPServer:
             
         except Exception as e:
             # Log the error
-            execution_time = (datetime.now(timezone.utc) - start_time).total_seconds() * 1000
+            execution_time = (time.monotonic_ns() - start_ns) / 1e6
             self.metrics["failed_executions"] += 1
             
             error_result = ToolExecutionResult(
@@ -200,7 +262,8 @@ class MCPServer:
                 result=error_result,
                 status="error",
                 execution_time_ms=execution_time,
-                error=str(e)
+                error=str(e),
+                fingerprint=fingerprint
             )
             
             logger.error(f"Tool execution failed: {str(e)}", exc_info=True)
@@ -209,43 +272,59 @@ class MCPServer:
                 detail=f"Tool execution failed: {str(e)}"
             )
     
-    def _validate_parameters(self, tool_def: ToolDefinition, parameters: Dict[str, Any]) -> None:
-        """Validate parameters against the tool definition."""
-        # Check required parameters
-        for param in tool_def.required:
-            if param not in parameters:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"Missing required parameter: {param}"
-                )
+    def _build_validator(self, tool_def: ToolDefinition) -> Callable[[Dict[str, Any]], None]:
+        """Build a parameter validator for a tool.
         
-        # Check parameter types (simplified)
-        for param, value in parameters.items():
-            if param in tool_def.parameters:
-                expected_type = tool_def.parameters[param].get("type")
-                if expected_type and not isinstance(value, self._get_python_type(expected_type)):
+        The required parameters and expected Python types are resolved once
+        at registration, so each execution only runs the checks themselves.
+        """
+        required = tuple(tool_def.required)
+        expected_types = {
+            param: (schema["type"], self._get_python_type(schema["type"]))
+            for param, schema in tool_def.parameters.items()
+            if isinstance(schema, dict) and schema.get("type")
+        }
+        
+        def validate(parameters: Dict[str, Any]) -> None:
+            # Check required parameters
+            for param in required:
+                if param not in parameters:
+                    raise HTTPException(
+                        status_code=status.HTTP_400_BAD_REQUEST,
+                        detail=f"Missing required parameter: {param}"
+                    )
+            
+            # Check parameter types (simplified)
+            for param, value in parameters.items():
+                expected = expected_types.get(param)
+                if expected and not isinstance(value, expected[1]):
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
-                        detail=f"Parameter '{param}' should be of type {expected_type}"
+                        detail=f"Parameter '{param}' should be of type {expected[0]}"
                     )
+        
+        return validate
     
     def _get_python_type(self, type_str: str) -> type:
         """Convert JSON schema type to Python type."""
-        type_map = {
-            "string": str,
-            "number": (int, float),
-            "integer": int,
-            "boolean": bool,
-            "array": list,
-            "object": dict
-        }
-        return type_map.get(type_str, str)
+        return JSON_SCHEMA_TYPES.get(type_str, str)
     
     def _generate_request_id(self) -> str:
         """Generate a unique request ID."""
-        return hashlib.sha256(
-            f"{datetime.now(timezone.utc).isoformat()}".encode()
-        ).hexdigest()[:16]
+        return secrets.token_hex(8)
+    
+    @staticmethod
+    def _fingerprint_parameters(parameters: Dict[str, Any]) -> Tuple[str, int]:
+        """Return a short hash and the encoded size of a tool's parameters.
+        
+        Parameters orjson cannot encode (e.g. non-string keys) fall back to
+        their repr, so fingerprinting never fails an execution.
+        """
+        try:
+            encoded_parameters = orjson.dumps(parameters, default=str, option=orjson.OPT_SORT_KEYS)
+        except (orjson.JSONEncodeError, TypeError):
+            encoded_parameters = repr(parameters).encode()
+        return hashlib.blake2b(encoded_parameters, digest_size=8).hexdigest(), len(encoded_parameters)
     
     def _log_execution(
         self,
@@ -256,35 +335,40 @@ class MCPServer:
         result: ToolExecutionResult,
         status: str,
         execution_time_ms: float,
-        error: Optional[str] = None
+        error: Optional[str] = None,
+        fingerprint: Optional[Tuple[str, int]] = None
     ) -> None:
-        """Log tool execution details."""
+        """Log tool execution details.
+        
+        Successful executions record a hash and the encoded size of their
+        parameters rather than the parameters themselves, so large payloads
+        are not kept alive in the log. Failures keep the full parameters.
+        """
+        parameters_hash, parameters_bytes = fingerprint or self._fingerprint_parameters(parameters)
         log_entry = {
             "execution_id": execution_id,
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": result.timestamp,
             "tool": tool_name,
             "agent_id": agent_id,
-            "parameters": parameters,
+            "parameters_hash": parameters_hash,
+            "parameters_bytes": parameters_bytes,
             "status": status,
             "execution_time_ms": execution_time_ms,
-            "result": result.dict() if hasattr(result, 'dict') else str(result),
+            "result": msgspec.structs.asdict(result),
         }
         
         if error:
             log_entry["error"] = error
+            log_entry["parameters"] = parameters
         
+        # The deque drops the oldest entry once it holds EXECUTION_LOG_SIZE
         self.execution_log.append(log_entry)
-        
-        # Keep only the last 1000 executions in memory
-        if len(self.execution_log) > 1000:
-            self.execution_log = self.execution_log[-1000:]
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current server metrics."""
         return {
             **self.metrics,
             "registered_tools": len(self.tools),
-            "active_agents": len([a for a in self.agents.values() if a.status == "active"]),
             "uptime_seconds": (datetime.now(timezone.utc) - self.start_time).total_seconds()
             if hasattr(self, 'start_time') else 0
         }
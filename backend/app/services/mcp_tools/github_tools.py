@@ -4,14 +4,20 @@ GitHub Tools for MCP Server
 This module provides tools for interacting with the GitHub API through the MCP server.
 """
 import os
+import asyncio
 import logging
-from typing import Dict, Any, List, Optional
-from datetime import datetime, timedelta
+import secrets
+import time
+from dataclasses import dataclass
+from collections import Counter, OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+from datetime import datetime, timedelta, timezone
 import httpx
+import orjson
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
 from github import Github, GithubIntegration, Auth
 from github.Repository import Repository
-from github.WorkflowRun import WorkflowRun
-from github.PaginatedList import PaginatedList
 
 from app.core.config import settings
 from app.services.mcp_server import ToolDefinition
@@ -19,6 +25,43 @@ from app.schemas.mcp import ToolParameterSchema, ToolParameterType
 
 logger = logging.getLogger(__name__)
 
+GITHUB_API_URL = "https://api.github.com"
+
+# Revalidated REST responses kept in memory, least recently used evicted first
+ETAG_CACHE_SIZE = 512
+
+# Dependabot alerts fetched per analysis; a full page is reported as "N+"
+DEPENDABOT_ALERTS_PAGE_SIZE = 100
+
+# How long a worker holds the Redis lock while minting an installation token
+TOKEN_LOCK_SECONDS = 10
+
+# Deletes the token lock only if it still holds this worker's value, so a
+# worker whose lock expired can't release another worker's
+RELEASE_LOCK_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+
+def _timestamp_seconds(value: str) -> float:
+    """Convert an ISO 8601 timestamp from a GitHub API payload to POSIX seconds.
+    
+    Durations are then plain float subtraction, with no timedelta allocated.
+    """
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+def _as_utc(value: datetime) -> datetime:
+    """Return a timezone-aware UTC datetime.
+    
+    PyGithub 2.x returns aware expiry times while older releases return naive
+    UTC ones, so expiries are normalized before they are compared.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
 # Tool Definitions
 ANALYZE_REPO_TOOL = {
     "name": "github.analyze_repository",
@@ -54,7 +97,8 @@ GET_WORKFLOW_RUN_LOGS_TOOL = {
     "parameters": {
         "owner": {"type": "string", "description": "Repository owner"},
         "repo": {"type": "string", "description": "Repository name"},
-        "run_id": {"type": "integer", "description": "ID of the workflow run"}
+        "run_id": {"type": "integer", "description": "ID of the workflow run"},
+        "include_metadata": {"type": "boolean", "description": "Also fetch the run's status and conclusion", "default": False}
     },
     "required": ["owner", "repo", "run_id"]
 }
@@ -73,6 +117,100 @@ CREATE_ISSUE_TOOL = {
     "required": ["owner", "repo", "title"]
 }
 
+CREATE_ISSUES_BATCH_TOOL = {
+    "name": "github.create_issues_batch",
+    "description": "Create several GitHub issues in one call, one after another, reporting each issue's result",
+    "parameters": {
+        "owner": {"type": "string", "description": "Repository owner"},
+        "repo": {"type": "string", "description": "Repository name"},
+        "issues": {
+            "type": "array",
+            "description": "Issues to create, each with a title and optional body, labels and assignees",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "title": {"type": "string"},
+                    "body": {"type": "string"},
+                    "labels": {"type": "array", "items": {"type": "string"}},
+                    "assignees": {"type": "array", "items": {"type": "string"}}
+                },
+                "required": ["title"]
+            }
+        }
+    },
+    "required": ["owner", "repo", "issues"]
+}
+
+@dataclass
+class TokenEntry:
+    """A cached installation token and its expiry."""
+    __slots__ = ("token", "expires_at")
+    token: str
+    expires_at: datetime
+
+@dataclass
+class AnalysisEntry:
+    """A cached repository analysis and the time.monotonic() it was computed at."""
+    __slots__ = ("computed_at", "summary")
+    computed_at: float
+    summary: Dict[str, Any]
+
+class TokenCache:
+    """Bounded LRU cache of installation tokens that forgets tokens close to expiry."""
+    
+    def __init__(self, max_size: int = 1024, refresh_buffer_seconds: int = 300):
+        self.max_size = max_size
+        self.refresh_buffer = timedelta(seconds=refresh_buffer_seconds)
+        self._entries: "OrderedDict[int, TokenEntry]" = OrderedDict()
+    
+    def get(self, key: int) -> Optional[str]:
+        """Return the cached token, or None if it is missing or due for refresh."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if datetime.now(timezone.utc) >= entry.expires_at - self.refresh_buffer:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return entry.token
+    
+    def set(self, key: int, token: str, expires_at: datetime) -> None:
+        """Cache a token, evicting the least recently used one when full."""
+        self._entries[key] = TokenEntry(token, _as_utc(expires_at))
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+class AnalysisCache:
+    """Bounded LRU cache of repository analyses that forgets expired ones."""
+    
+    def __init__(self, max_size: int = 256, ttl_seconds: int = 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple[str, str, str, int], AnalysisEntry]" = OrderedDict()
+    
+    def get(self, key: Tuple[str, str, str, int]) -> Optional[Dict[str, Any]]:
+        """Return the cached summary, or None if it is missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        
+        if time.monotonic() - entry.computed_at >= self.ttl_seconds:
+            del self._entries[key]
+            return None
+        
+        self._entries.move_to_end(key)
+        return entry.summary
+    
+    def set(self, key: Tuple[str, str, str, int], summary: Dict[str, Any]) -> None:
+        """Cache a summary, evicting the least recently used one when full."""
+        self._entries[key] = AnalysisEntry(time.monotonic(), summary)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
 class GitHubTools:
     """GitHub tools for the MCP server."""
     
@@ -81,7 +219,22 @@ class GitHubTools:
         self.private_key = settings.GITHUB_APP_PRIVATE_KEY
         self.client = None
         self._integration = None
-        self._installation_tokens = {}
+        # Tokens belong to an installation, not a repository
+        self._installation_ids: Dict[str, int] = {}
+        self._installation_tokens = TokenCache(
+            refresh_buffer_seconds=settings.GITHUB_TOKEN_REFRESH_BUFFER_SECONDS
+        )
+        self._token_locks: Dict[int, asyncio.Lock] = {}
+        # One PyGithub client per installation, with the token it was built for
+        self._gh_clients: Dict[int, Tuple[str, Github]] = {}
+        self._http: Optional[httpx.AsyncClient] = None
+        self._redis: Optional[aioredis.Redis] = None
+        # Slowly changing REST responses keyed by (owner, repo, endpoint), with their ETag
+        self._etag_cache: "OrderedDict[Tuple[str, str, str], Tuple[str, Any]]" = OrderedDict()
+        # Recent analyses keyed by (owner, repo, branch, lookback_days)
+        self._analysis_cache = AnalysisCache(ttl_seconds=settings.GITHUB_ANALYSIS_CACHE_TTL_SECONDS)
+        # Only held while an analysis is in flight
+        self._analysis_locks: Dict[Tuple[str, str, str, int], asyncio.Lock] = {}
     
     @property
     def integration(self):
@@ -91,41 +244,200 @@ class GitHubTools:
             self._integration = GithubIntegration(auth=auth)
         return self._integration
     
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """Lazy-load the HTTP client shared by all direct REST calls."""
+        if self._http is None:
+            # Every call goes to api.github.com, so HTTP/2 multiplexes concurrent
+            # requests over a single connection
+            self._http = httpx.AsyncClient(
+                base_url=GITHUB_API_URL,
+                headers={
+                    "Accept": "application/vnd.github+json",
+                    "X-GitHub-Api-Version": "2022-11-28"
+                },
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64, keepalive_expiry=60.0),
+                timeout=httpx.Timeout(30.0, connect=5.0)
+            )
+        return self._http
+    
+    @property
+    def redis(self) -> Optional[aioredis.Redis]:
+        """Lazy-load the Redis client, or None when REDIS_URL is not configured."""
+        if self._redis is None and settings.REDIS_URL:
+            self._redis = aioredis.from_url(settings.REDIS_URL)
+        return self._redis
+    
+    async def close(self) -> None:
+        """Close the shared HTTP and Redis clients."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+    
+    async def _get_installation_id(self, owner: str, repo: str) -> int:
+        """Get the GitHub App installation ID for a repository."""
+        # Installation IDs never change for a repository, so they are cached indefinitely
+        repo_key = f"{owner}/{repo}"
+        installation_id = self._installation_ids.get(repo_key)
+        if installation_id is None:
+            installation = self.integration.get_installation(owner, repo)
+            installation_id = self._installation_ids[repo_key] = installation.id
+        return installation_id
+    
     async def get_installation_token(self, owner: str, repo: str) -> str:
         """Get an installation token for a repository."""
-        cache_key = f"{owner}/{repo}"
-        
-        # Check if we have a valid cached token
-        if cache_key in self._installation_tokens:
-            token_data = self._installation_tokens[cache_key]
-            if datetime.utcnow() < token_data["expires_at"] - timedelta(minutes=5):
-                return token_data["token"]
-        
-        # Get a new installation token
         try:
             # Get installation ID for the repository
-            installation = self.integration.get_installation(owner, repo)
-            
-            # Create installation access token
-            auth = self.integration.get_access_token(installation.id)
-            
-            # Cache the token
-            self._installation_tokens[cache_key] = {
-                "token": auth.token,
-                "expires_at": auth.expires_at
-            }
-            
-            return auth.token
+            installation_id = await self._get_installation_id(owner, repo)
+            
+            # Only one coroutine refreshes a given installation's token at a time
+            lock = self._token_locks.setdefault(installation_id, asyncio.Lock())
+            async with lock:
+                # Check if we have a valid cached token
+                token = self._installation_tokens.get(installation_id)
+                if token:
+                    return token
+                
+                # Share tokens between workers through Redis when it is configured
+                if self.redis is not None:
+                    try:
+                        return await self._get_shared_token(installation_id)
+                    except RedisError as e:
+                        # Redis being down must not stop GitHub access
+                        logger.warning(f"Redis unavailable, minting installation token locally: {str(e)}")
+                
+                return self._mint_token(installation_id).token
             
         except Exception as e:
             logger.error(f"Failed to get installation token: {str(e)}")
             raise Exception(f"Failed to authenticate with GitHub: {str(e)}")
     
+    def _mint_token(self, installation_id: int) -> Any:
+        """Create an installation access token and cache it locally."""
+        auth = self.integration.get_access_token(installation_id)
+        self._installation_tokens.set(installation_id, auth.token, auth.expires_at)
+        return auth
+    
+    async def _get_shared_token(self, installation_id: int) -> str:
+        """Get an installation token from Redis, minting it if no worker has yet.
+        
+        A SET NX lock ensures only one worker mints a token for an installation;
+        the others poll until it appears or the lock expires.
+        """
+        token_key = f"gh:token:{installation_id}"
+        lock_key = f"gh:lock:{installation_id}"
+        lock_value = secrets.token_hex(16)
+        deadline = time.monotonic() + TOKEN_LOCK_SECONDS
+        
+        while True:
+            cached = await self.redis.get(token_key)
+            if cached:
+                data = orjson.loads(cached)
+                expires_at = _as_utc(datetime.fromisoformat(data["expires_at"]))
+                self._installation_tokens.set(installation_id, data["token"], expires_at)
+                return data["token"]
+            
+            locked = await self.redis.set(lock_key, lock_value, nx=True, ex=TOKEN_LOCK_SECONDS)
+            if locked or time.monotonic() > deadline:
+                break
+            await asyncio.sleep(0.1)
+        
+        try:
+            auth = self._mint_token(installation_id)
+            
+            # Expire the shared copy when it is due for refresh; EX must be at least 1
+            expires_at = _as_utc(auth.expires_at)
+            ttl = expires_at - self._installation_tokens.refresh_buffer - datetime.now(timezone.utc)
+            ttl_seconds = max(int(ttl.total_seconds()), 1)
+            try:
+                await self.redis.set(
+                    token_key,
+                    orjson.dumps({"token": auth.token, "expires_at": expires_at.isoformat()}),
+                    ex=ttl_seconds
+                )
+            except RedisError as e:
+                # The token is still good locally; other workers will mint their own
+                logger.warning(f"Failed to share installation token through Redis: {str(e)}")
+            return auth.token
+        finally:
+            if locked:
+                try:
+                    await self.redis.eval(RELEASE_LOCK_SCRIPT, 1, lock_key, lock_value)
+                except RedisError as e:
+                    # The lock expires on its own after TOKEN_LOCK_SECONDS
+                    logger.warning(f"Failed to release installation token lock: {str(e)}")
+    
     async def get_repository(self, owner: str, repo: str) -> Repository:
         """Get a GitHub repository client."""
         token = await self.get_installation_token(owner, repo)
-        g = Github(token)
-        return g.get_repo(f"{owner}/{repo}")
+        installation_id = await self._get_installation_id(owner, repo)
+        
+        # Reuse the installation's client and its connection pool until the token rotates
+        client = self._gh_clients.get(installation_id)
+        if client is None or client[0] != token:
+            client = self._gh_clients[installation_id] = (token, Github(token, per_page=100))
+        return client[1].get_repo(f"{owner}/{repo}")
+    
+    async def _gh_request(self, method: str, path: str, token: str, **kwargs: Any) -> httpx.Response:
+        """Send an authenticated request to the GitHub REST API.
+        
+        Args:
+            method: HTTP method
+            path: API path relative to https://api.github.com
+            token: Installation token to authenticate with
+            **kwargs: Extra arguments for httpx, e.g. params or headers
+            
+        Returns:
+            The response; raising on error statuses is left to the caller
+        """
+        headers = {"Authorization": f"Bearer {token}", **kwargs.pop("headers", {})}
+        return await self.http.request(method, path, headers=headers, **kwargs)
+    
+    async def _cached_get(self, token: str, owner: str, repo: str, endpoint: str, **params: Any) -> Any:
+        """GET a repository endpoint, revalidating any cached body with its ETag.
+        
+        A 304 Not Modified response does not count against the rate limit.
+        """
+        key = (owner, repo, endpoint)
+        cached = self._etag_cache.get(key)
+        headers = {"If-None-Match": cached[0]} if cached else {}
+        
+        response = await self._gh_request(
+            "GET", f"/repos/{owner}/{repo}/{endpoint}", token, params=params or None, headers=headers
+        )
+        if response.status_code == 304 and cached:
+            self._etag_cache.move_to_end(key)
+            return cached[1]
+        response.raise_for_status()
+        
+        body = response.json()
+        etag = response.headers.get("ETag")
+        if etag:
+            self._etag_cache[key] = (etag, body)
+            self._etag_cache.move_to_end(key)
+            if len(self._etag_cache) > ETAG_CACHE_SIZE:
+                self._etag_cache.popitem(last=False)
+        return body
+    
+    async def _list_workflow_runs(self, token: str, owner: str, repo: str, **params: Any) -> List[Dict[str, Any]]:
+        """Fetch every workflow run matching the filters, 100 runs per request."""
+        runs = []
+        page = 1
+        while True:
+            response = await self._gh_request(
+                "GET", f"/repos/{owner}/{repo}/actions/runs", token,
+                params={**params, "per_page": 100, "page": page}
+            )
+            response.raise_for_status()
+            data = response.json()
+            runs.extend(data["workflow_runs"])
+            if not data["workflow_runs"] or len(runs) >= data["total_count"]:
+                return runs
+            page += 1
     
     async def analyze_repository(
         self, 
@@ -147,120 +459,187 @@ class GitHubTools:
         Returns:
             Dictionary containing analysis results
         """
+        key = (owner, repo, branch, lookback_days)
+        
+        summary = self._analysis_cache.get(key)
+        if summary is not None:
+            return summary
+        
+        # Concurrent identical requests wait for a single analysis
+        lock = self._analysis_locks.get(key)
+        owns_lock = lock is None
+        if owns_lock:
+            lock = self._analysis_locks[key] = asyncio.Lock()
+        try:
+            async with lock:
+                summary = self._analysis_cache.get(key)
+                if summary is not None:
+                    return summary
+                
+                summary = await self._analyze_repository(owner, repo, branch, lookback_days)
+                self._analysis_cache.set(key, summary)
+                return summary
+        finally:
+            # Waiters keep their reference; later callers find the cached summary
+            if owns_lock:
+                del self._analysis_locks[key]
+    
+    async def _analyze_repository(self, owner: str, repo: str, branch: str, lookback_days: int) -> Dict[str, Any]:
+        """Run a repository analysis without consulting the cache."""
         try:
             # Get repository and workflow runs
-            repository = await self.get_repository(owner, repo)
+            token = await self.get_installation_token(owner, repo)
             since = datetime.utcnow() - timedelta(days=lookback_days)
             
-            # Get workflow runs for the specified branch
-            workflow_runs = repository.get_workflow_runs(
-                branch=branch,
-                created=f">={since.isoformat()}"
+            # Fetch workflow runs for the specified branch, languages and
+            # open Dependabot alerts concurrently
+            workflow_runs, languages, dependabot_alerts = await asyncio.gather(
+                self._list_workflow_runs(
+                    token, owner, repo,
+                    branch=branch,
+                    created=f">={since.isoformat()}"
+                ),
+                self._cached_get(token, owner, repo, "languages"),
+                self._cached_get(
+                    token, owner, repo, "dependabot/alerts",
+                    state="open", per_page=DEPENDABOT_ALERTS_PAGE_SIZE
+                ),
+                return_exceptions=True
             )
+            if isinstance(workflow_runs, Exception):
+                raise workflow_runs
             
-            # Analyze workflow runs
-            total_runs = workflow_runs.totalCount
-            successful_runs = sum(1 for run in workflow_runs if run.conclusion == "success")
-            failed_runs = sum(1 for run in workflow_runs if run.conclusion == "failure")
-            cancelled_runs = sum(1 for run in workflow_runs if run.conclusion == "cancelled")
-            
-            # Calculate metrics
-            success_rate = (successful_runs / total_runs * 100) if total_runs > 0 else 0
-            
-            # Calculate average duration
-            durations = []
-            for run in workflow_runs:
-                if run.status == "completed" and run.created_at and run.updated_at:
-                    duration = (run.updated_at - run.created_at).total_seconds()
-                    durations.append(duration)
+            # Repository languages are optional
+            if isinstance(languages, Exception):
+                logger.warning(f"Failed to get repository languages: {str(languages)}")
+                languages = {}
             
-            avg_duration = sum(durations) / len(durations) if durations else 0
+            # Check for outdated dependencies
+            security_recommendations = []
+            try:
+                if isinstance(dependabot_alerts, Exception):
+                    raise dependabot_alerts
+                if dependabot_alerts:
+                    # Only the first page is fetched, so a full page means there may be more
+                    alert_count = f"{len(dependabot_alerts)}"
+                    if len(dependabot_alerts) >= DEPENDABOT_ALERTS_PAGE_SIZE:
+                        alert_count += "+"
+                    security_recommendations.append({
+                        "type": "security",
+                        "severity": "high",
+                        "message": f"{alert_count} security vulnerabilities found",
+                        "suggestion": "Update dependencies to their latest secure versions using Dependabot or similar tools."
+                    })
+            except Exception as e:
+                logger.warning(f"Failed to get vulnerability alerts: {str(e)}")
             
-            # Identify frequent failures
+            # Nothing to aggregate for branches without recent runs
+            total_runs = len(workflow_runs)
+            if total_runs == 0:
+                return {
+                    "repository": f"{owner}/{repo}",
+                    "branch": branch,
+                    "analysis_period_days": lookback_days,
+                    "total_workflow_runs": 0,
+                    "success_rate_percent": 0,
+                    "failed_runs": 0,
+                    "cancelled_runs": 0,
+                    "avg_workflow_duration_seconds": 0,
+                    "workflow_metrics": [],
+                    "languages": languages,
+                    "recommendations": security_recommendations,
+                    "analysis_timestamp": datetime.utcnow().isoformat()
+                }
+            
+            # Analyze workflow runs in a single pass
+            conclusion_counts = Counter()
+            duration_sum = 0.0
+            duration_count = 0
             workflows = {}
+            
             for run in workflow_runs:
-                if not run.workflow_id:
+                conclusion = run["conclusion"]
+                conclusion_counts[conclusion] += 1
+                
+                duration = None
+                if run["status"] == "completed" and run["created_at"] and run["updated_at"]:
+                    duration = _timestamp_seconds(run["updated_at"]) - _timestamp_seconds(run["created_at"])
+                    duration_sum += duration
+                    duration_count += 1
+                
+                # Identify frequent failures
+                if not run["workflow_id"]:
                     continue
-                    
-                workflow_name = run.name or f"Workflow {run.workflow_id}"
-                if workflow_name not in workflows:
-                    workflows[workflow_name] = {
+                
+                workflow_name = run["name"] or f"Workflow {run['workflow_id']}"
+                data = workflows.get(workflow_name)
+                if data is None:
+                    data = workflows[workflow_name] = {
                         "total_runs": 0,
                         "successful_runs": 0,
                         "failed_runs": 0,
-                        "durations": []
+                        "duration_sum": 0.0,
+                        "duration_count": 0
                     }
                 
-                workflows[workflow_name]["total_runs"] += 1
-                if run.conclusion == "success":
-                    workflows[workflow_name]["successful_runs"] += 1
-                elif run.conclusion == "failure":
-                    workflows[workflow_name]["failed_runs"] += 1
+                data["total_runs"] += 1
+                if conclusion == "success":
+                    data["successful_runs"] += 1
+                elif conclusion == "failure":
+                    data["failed_runs"] += 1
                 
-                if run.status == "completed" and run.created_at and run.updated_at:
-                    duration = (run.updated_at - run.created_at).total_seconds()
-                    workflows[workflow_name]["durations"].append(duration)
+                if duration is not None:
+                    data["duration_sum"] += duration
+                    data["duration_count"] += 1
+            
+            successful_runs = conclusion_counts["success"]
+            failed_runs = conclusion_counts["failure"]
+            cancelled_runs = conclusion_counts["cancelled"]
+            
+            # Calculate metrics
+            success_rate = successful_runs / total_runs * 100
+            avg_duration = duration_sum / duration_count if duration_count else 0
             
             # Calculate workflow metrics
             workflow_metrics = []
             for name, data in workflows.items():
                 if data["total_runs"] > 0:
-                    success_rate = (data["successful_runs"] / data["total_runs"]) * 100
-                    avg_duration = sum(data["durations"]) / len(data["durations"]) if data["durations"] else 0
+                    workflow_success_rate = (data["successful_runs"] / data["total_runs"]) * 100
+                    workflow_avg_duration = data["duration_sum"] / data["duration_count"] if data["duration_count"] else 0
                     
                     workflow_metrics.append({
                         "name": name,
                         "total_runs": data["total_runs"],
-                        "success_rate": round(success_rate, 2),
-                        "avg_duration_seconds": round(avg_duration, 2),
-                        "failure_rate": round(100 - success_rate, 2)
+                        "success_rate": round(workflow_success_rate, 2),
+                        "avg_duration_seconds": round(workflow_avg_duration, 2),
+                        "failure_rate": round(100 - workflow_success_rate, 2)
                     })
             
             # Sort workflows by failure rate (highest first)
             workflow_metrics.sort(key=lambda x: x["failure_rate"], reverse=True)
             
-            # Get repository languages
-            try:
-                languages = repository.get_languages()
-            except Exception as e:
-                logger.warning(f"Failed to get repository languages: {str(e)}")
-                languages = {}
-            
-            # Generate recommendations
-            recommendations = []
-            
-            # Check for long-running workflows
+            # Generate recommendations, checking each workflow in one pass for
+            # long-running and flaky workflows
+            performance_recommendations = []
+            reliability_recommendations = []
             for workflow in workflow_metrics:
                 if workflow["avg_duration_seconds"] > 600:  # More than 10 minutes
-                    recommendations.append({
+                    performance_recommendations.append({
                         "type": "performance",
                         "severity": "high",
                         "message": f"Workflow '{workflow['name']}' is slow (avg {workflow['avg_duration_seconds']:.1f}s)",
                         "suggestion": "Consider optimizing the workflow by caching dependencies, running jobs in parallel, or using matrix builds."
                     })
-            
-            # Check for flaky tests
-            for workflow in workflow_metrics:
+                
                 if workflow["failure_rate"] > 20:  # More than 20% failure rate
-                    recommendations.append({
+                    reliability_recommendations.append({
                         "type": "reliability",
                         "severity": "critical" if workflow["failure_rate"] > 50 else "high",
                         "message": f"High failure rate in workflow '{workflow['name']}' ({workflow['failure_rate']:.1f}%)",
                         "suggestion": "Investigate test failures and add retry logic for flaky tests."
                     })
             
-            # Check for outdated dependencies
-            try:
-                dependabot_alerts = repository.get_vulnerability_alert()
-                if dependabot_alerts.totalCount > 0:
-                    recommendations.append({
-                        "type": "security",
-                        "severity": "high",
-                        "message": f"{dependabot_alerts.totalCount} security vulnerabilities found",
-                        "suggestion": "Update dependencies to their latest secure versions using Dependabot or similar tools."
-                    })
-            except Exception as e:
-                logger.warning(f"Failed to get vulnerability alerts: {str(e)}")
+            recommendations = performance_recommendations + reliability_recommendations + security_recommendations
             
             # Generate summary
             summary = {
@@ -311,10 +690,10 @@ class GitHubTools:
             Dictionary containing workflow runs and pagination info
         """
         try:
-            repository = await self.get_repository(owner, repo)
+            token = await self.get_installation_token(owner, repo)
             
             # Build query parameters
-            query_params = {}
+            query_params = {"per_page": per_page, "page": page}
             if branch:
                 query_params["branch"] = branch
             if event:
@@ -322,32 +701,35 @@ class GitHubTools:
             if status:
                 query_params["status"] = status
             
-            # Get workflow runs with pagination
-            workflow_runs = repository.get_workflow_runs(**query_params)
-            
-            # Apply pagination
-            total_count = workflow_runs.totalCount
-            runs_page = list(workflow_runs.get_page(page - 1))  # GitHub is 0-based for pages
+            # Fetch the requested page as raw JSON rather than lazily loaded PyGithub objects
+            response = await self._gh_request(
+                "GET", f"/repos/{owner}/{repo}/actions/runs", token, params=query_params
+            )
+            response.raise_for_status()
+            data = response.json()
+            total_count = data["total_count"]
             
             # Format runs
             runs = []
-            for run in runs_page:
+            for run in data["workflow_runs"]:
+                created_at = run["created_at"]
+                updated_at = run["updated_at"]
                 runs.append({
-                    "id": run.id,
-                    "name": run.name,
-                    "head_branch": run.head_branch,
-                    "head_sha": run.head_sha,
-                    "run_number": run.run_number,
-                    "event": run.event,
-                    "status": run.status,
-                    "conclusion": run.conclusion,
-                    "workflow_id": run.workflow_id,
-                    "url": run.html_url,
-                    "created_at": run.created_at.isoformat() if run.created_at else None,
-                    "updated_at": run.updated_at.isoformat() if run.updated_at else None,
-                    "run_started_at": run.run_started_at.isoformat() if run.run_started_at else None,
-                    "duration_seconds": (run.updated_at - run.created_at).total_seconds() 
-                                      if run.updated_at and run.created_at else None
+                    "id": run["id"],
+                    "name": run["name"],
+                    "head_branch": run["head_branch"],
+                    "head_sha": run["head_sha"],
+                    "run_number": run["run_number"],
+                    "event": run["event"],
+                    "status": run["status"],
+                    "conclusion": run["conclusion"],
+                    "workflow_id": run["workflow_id"],
+                    "url": run["html_url"],
+                    "created_at": created_at,
+                    "updated_at": updated_at,
+                    "run_started_at": run.get("run_started_at"),
+                    "duration_seconds": _timestamp_seconds(updated_at) - _timestamp_seconds(created_at)
+                                      if updated_at and created_at else None
                 })
             
             return {
@@ -366,6 +748,7 @@ class GitHubTools:
         owner: str,
         repo: str,
         run_id: int,
+        include_metadata: bool = False,
         **kwargs
     ) -> Dict[str, Any]:
         """
@@ -375,27 +758,31 @@ class GitHubTools:
             owner: Repository owner
             repo: Repository name
             run_id: ID of the workflow run
+            include_metadata: Also fetch the run's status and conclusion (default: False)
             
         Returns:
             Dictionary containing log information
         """
         try:
-            repository = await self.get_repository(owner, repo)
-            
-            # Get the workflow run
-            run = repository.get_workflow_run(run_id)
+            # The URLs follow from the run ID, so the run is only fetched when
+            # its status is asked for (GitHub provides a zip file of logs)
+            run_url = f"{GITHUB_API_URL}/repos/{owner}/{repo}/actions/runs/{run_id}"
+            result = {
+                "run_id": run_id,
+                "logs_url": f"{run_url}/logs",
+                "artifacts_url": f"{run_url}/artifacts",
+                "jobs_url": f"{run_url}/jobs"
+            }
             
-            # Get the logs URL (GitHub provides a zip file of logs)
-            logs_url = f"https://api.github.com/repos/{owner}/{repo}/actions/runs/{run_id}/logs"
+            if include_metadata:
+                token = await self.get_installation_token(owner, repo)
+                response = await self._gh_request("GET", f"/repos/{owner}/{repo}/actions/runs/{run_id}", token)
+                response.raise_for_status()
+                run = response.json()
+                result["status"] = run["status"]
+                result["conclusion"] = run["conclusion"]
             
-            return {
-                "run_id": run.id,
-                "status": run.status,
-                "conclusion": run.conclusion,
-                "logs_url": logs_url,
-                "artifacts_url": run.artifacts_url,
-                "jobs_url": run.jobs_url
-            }
+            return result
             
         except Exception as e:
             logger.error(f"Failed to get workflow run logs: {str(e)}", exc_info=True)
@@ -453,6 +840,88 @@ class GitHubTools:
             logger.error(f"Failed to create issue: {str(e)}", exc_info=True)
             raise Exception(f"Failed to create issue: {str(e)}")
 
+    async def create_issues_batch(
+        self,
+        owner: str,
+        repo: str,
+        issues: List[Dict[str, Any]],
+        **kwargs
+    ) -> Dict[str, Any]:
+        """
+        Create several GitHub issues, one after another.
+        
+        GitHub's secondary rate limits ask for content-creating requests to be
+        sent serially. A failed issue does not stop the rest of the batch.
+        
+        Args:
+            owner: Repository owner
+            repo: Repository name
+            issues: Issues to create, each with a title and optional body, labels and assignees
+            
+        Returns:
+            Dictionary with one result per requested issue, in request order: the
+            created issue, or the error that prevented it
+        """
+        try:
+            # Validate the whole batch before creating anything
+            for index, issue in enumerate(issues):
+                if not isinstance(issue, dict) or not isinstance(issue.get("title"), str) or not issue["title"]:
+                    raise ValueError(f"Issue at index {index} is missing a title")
+            
+            token = await self.get_installation_token(owner, repo)
+            
+        except Exception as e:
+            logger.error(f"Failed to create issues: {str(e)}", exc_info=True)
+            raise Exception(f"Failed to create issues: {str(e)}")
+        
+        results = []
+        created_count = 0
+        for index, issue in enumerate(issues):
+            try:
+                response = await self._gh_request(
+                    "POST", f"/repos/{owner}/{repo}/issues", token,
+                    json={
+                        "title": issue["title"],
+                        "body": issue.get("body", ""),
+                        "labels": issue.get("labels") or [],
+                        "assignees": issue.get("assignees") or []
+                    }
+                )
+                response.raise_for_status()
+                created = response.json()
+                results.append({
+                    "index": index,
+                    "success": True,
+                    "issue": {
+                        "id": created["id"],
+                        "number": created["number"],
+                        "title": created["title"],
+                        "body": created["body"],
+                        "state": created["state"],
+                        "url": created["html_url"],
+                        "created_at": created["created_at"],
+                        "updated_at": created["updated_at"],
+                        "labels": [label["name"] for label in created["labels"]],
+                        "assignees": [assignee["login"] for assignee in created["assignees"]]
+                    }
+                })
+                created_count += 1
+            except Exception as e:
+                # Report the failure and carry on; earlier issues already exist
+                logger.error(f"Failed to create issue {index} in {owner}/{repo}: {str(e)}")
+                results.append({
+                    "index": index,
+                    "success": False,
+                    "title": issue["title"],
+                    "error": str(e)
+                })
+        
+        return {
+            "created": created_count,
+            "failed": len(issues) - created_count,
+            "issues": results
+        }
+
 # Create a singleton instance
 github_tools = GitHubTools()
 
@@ -483,4 +952,10 @@ def register_github_tools(mcp_server):
         github_tools.create_issue
     )
     
+    # Register batch create issues tool
+    mcp_server.register_tool(
+        CREATE_ISSUES_BATCH_TOOL,
+        github_tools.create_issues_batch
+    )
+    
     logger.info("Registered GitHub tools with MCP server")
@@ -3,7 +3,6 @@ Slack Tools for MCP Server
 
 This module provides tools for interacting with the Slack API through the MCP server.
 """
-import json
 import logging
 import hmac
 import hashlib
@@ -12,10 +11,12 @@ from typing import Dict, Any, List, Optional, Union
 from datetime import datetime
 
 import httpx
+import orjson
 from fastapi import HTTPException, status
 from pydantic import BaseModel, HttpUrl
 
 from app.core.config import settings
+from app.core.slack_client import SLACK_API_URL, close_slack_client, get_slack_client, slack_auth_headers
 from app.services.mcp_server import ToolDefinition
 
 logger = logging.getLogger(__name__)
@@ -58,49 +59,63 @@ UPDATE_MESSAGE_TOOL = {
     "required": ["channel", "ts"]
 }
 
+# Length of a Slack request signature: "v0=" + hex SHA-256 digest
+SLACK_SIGNATURE_LENGTH = 3 + 64
+
 class SlackTools:
     """Slack tools for the MCP server."""
     
     def __init__(self):
         self.token = settings.SLACK_BOT_TOKEN
         self.signing_secret = settings.SLACK_SIGNING_SECRET
-        self.api_base_url = "https://slack.com/api"
-        self.client = httpx.AsyncClient(
-            base_url=self.api_base_url,
-            headers={
-                "Authorization": f"Bearer {self.token}",
-                "Content-Type": "application/json; charset=utf-8"
-            },
-            timeout=30.0
-        )
+        # Encoded once; every inbound Slack event is verified against it
+        self._signing_secret_bytes = (self.signing_secret or "").encode("utf-8")
+        self.api_base_url = SLACK_API_URL
+        # Sent with each request on the shared, token-less client
+        self.auth_headers = slack_auth_headers(self.token)
+    
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The process-wide Slack client shared by send_message, open_modal and update_message."""
+        return get_slack_client()
+    
+    async def aclose(self) -> None:
+        """Close the shared Slack HTTP client."""
+        await close_slack_client()
     
     async def verify_slack_request(self, request_body: bytes, headers: Dict[str, str]) -> bool:
         """Verify that a request is coming from Slack."""
+        # Get the signature and timestamp from headers
+        signature = headers.get("x-slack-signature", "")
+        timestamp = headers.get("x-slack-request-timestamp", "")
+        
+        # Slack signatures are always "v0=" plus 64 hex characters. Rejecting other
+        # shapes before hashing the body is safe: the expected length isn't secret.
+        if len(signature) != SLACK_SIGNATURE_LENGTH or not signature.startswith("v0="):
+            return False
+        
+        # Malformed timestamps are rejected quietly so bad headers can't flood the logs
         try:
-            # Get the signature and timestamp from headers
-            signature = headers.get("x-slack-signature", "")
-            timestamp = headers.get("x-slack-request-timestamp", "")
-            
-            # Check if the timestamp is too old (replay attack protection)
-            if abs(time.time() - float(timestamp)) > 60 * 5:
-                return False
-            
-            # Create the signature base string
-            sig_basestring = f"v0:{timestamp}:{request_body.decode('utf-8')}"
-            
-            # Create a new HMAC "signature"
-            my_signature = 'v0=' + hmac.new(
-                self.signing_secret.encode('utf-8'),
-                sig_basestring.encode('utf-8'),
-                hashlib.sha256
-            ).hexdigest()
-            
-            # Compare the signatures
-            return hmac.compare_digest(my_signature, signature)
-            
-        except Exception as e:
-            logger.error(f"Error verifying Slack request: {str(e)}")
+            request_ts = int(float(timestamp))
+        except (TypeError, ValueError, OverflowError):
+            return False
+        
+        # Check if the timestamp is too old (replay attack protection)
+        if abs(int(time.time()) - request_ts) > 60 * 5:
             return False
+        
+        # Create the signature base string from the raw body bytes
+        sig_basestring = b"v0:" + timestamp.encode("utf-8") + b":" + request_body
+        
+        # Create the expected signature
+        my_signature = b"v0=" + hmac.new(
+            self._signing_secret_bytes,
+            sig_basestring,
+            hashlib.sha256
+        ).hexdigest().encode("ascii")
+        
+        # Compare the signatures as bytes in constant time
+        return hmac.compare_digest(my_signature, signature.encode("utf-8"))
     
     async def send_message(
         self,
@@ -142,26 +157,29 @@ class SlackTools:
             
             response = await self.client.post(
                 "/chat.postMessage",
-                json=payload
+                content=orjson.dumps(payload),
+                headers=self.auth_headers
             )
             
             response.raise_for_status()
-            data = response.json()
+            raw = response.content
+            data = orjson.loads(raw) if raw else {}
             
             if not data.get("ok", False):
                 error = data.get("error", "unknown_error")
                 raise Exception(f"Slack API error: {error}")
             
+            message = data.get("message") or {}
             return {
                 "channel": data.get("channel"),
                 "ts": data.get("ts"),
                 "message": {
-                    "text": data.get("message", {}).get("text"),
-                    "user": data.get("message", {}).get("user"),
-                    "bot_id": data.get("message", {}).get("bot_id"),
-                    "type": data.get("message", {}).get("type")
+                    "text": message.get("text"),
+                    "user": message.get("user"),
+                    "bot_id": message.get("bot_id"),
+                    "type": message.get("type")
                 },
-                "response_metadata": data.get("response_metadata", {})
+                "response_metadata": data.get("response_metadata") or {}
             }
             
         except httpx.HTTPStatusError as e:
@@ -195,19 +213,22 @@ class SlackTools:
             
             response = await self.client.post(
                 "/views.open",
-                json=payload
+                content=orjson.dumps(payload),
+                headers=self.auth_headers
             )
             
             response.raise_for_status()
-            data = response.json()
+            raw = response.content
+            data = orjson.loads(raw) if raw else {}
             
             if not data.get("ok", False):
                 error = data.get("error", "unknown_error")
                 raise Exception(f"Slack API error: {error}")
             
+            view = data.get("view") or {}
             return {
-                "view_id": data.get("view", {}).get("id"),
-                "response_metadata": data.get("response_metadata", {})
+                "view_id": view.get("id"),
+                "response_metadata": data.get("response_metadata") or {}
             }
             
         except httpx.HTTPStatusError as e:
@@ -254,11 +275,13 @@ class SlackTools:
             
             response = await self.client.post(
                 "/chat.update",
-                json=payload
+                content=orjson.dumps(payload),
+                headers=self.auth_headers
             )
             
             response.raise_for_status()
-            data = response.json()
+            raw = response.content
+            data = orjson.loads(raw) if raw else {}
             
             if not data.get("ok", False):
                 error = data.get("error", "unknown_error")
@@ -268,7 +291,7 @@ class SlackTools:
                 "channel": data.get("channel"),
                 "ts": data.get("ts"),
                 "text": data.get("text"),
-                "message": data.get("message", {})
+                "message": data.get("message") or {}
             }
             
         except httpx.HTTPStatusError as e:
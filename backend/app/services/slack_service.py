@@ -1,13 +1,74 @@
 import logging
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Union
-from slack_sdk import WebClient
-from slack_sdk.errors import SlackApiError
-from slack_sdk.web.slack_response import SlackResponse
+
+import httpx
+import orjson
 
 from ..config import settings
+from ..core.slack_client import get_slack_client, slack_auth_headers
 
 logger = logging.getLogger(__name__)
 
+# Static block templates shared by every message. They are only ever
+# serialized, never mutated, so the same instances can be reused.
+_DIVIDER = {"type": "divider"}
+
+_DISMISS_BUTTON = {
+    "type": "button",
+    "text": {
+        "type": "plain_text",
+        "text": "Dismiss",
+        "emoji": True
+    },
+    "value": "dismiss",
+    "style": "danger"
+}
+
+_REQUEST_CHANGES_BUTTON = {
+    "type": "button",
+    "text": {
+        "type": "plain_text",
+        "text": "Request Changes",
+        "emoji": True
+    },
+    "value": "request_changes",
+    "style": "danger"
+}
+
+_APPROVAL_HEADER = {
+    "type": "header",
+    "text": {
+        "type": "plain_text",
+        "text": "✅ Pull Request Approval Requested",
+        "emoji": True
+    }
+}
+
+def _url_button(text: str, url: str, style: Optional[str] = None) -> Dict[str, Any]:
+    """Build a button block that links to a URL."""
+    button = {
+        "type": "button",
+        "text": {
+            "type": "plain_text",
+            "text": text,
+            "emoji": True
+        },
+        "url": url
+    }
+    if style:
+        button["style"] = style
+    return button
+
+def _view_pr_button(pr_url: str, text: str = "View Pull Request") -> Dict[str, Any]:
+    """Build the primary button that links to a pull request."""
+    return _url_button(text, pr_url, style="primary")
+
+@lru_cache(maxsize=1024)
+def _view_full_report_button(repository_url: str) -> Dict[str, Any]:
+    """Get the (shared, never mutated) button linking to a repository's Actions page."""
+    return _url_button("View Full Report", f"{repository_url}/actions", style="primary")
+
 class SlackService:
     """Service for interacting with the Slack API."""
     
@@ -18,16 +79,45 @@ class SlackService:
             token: Slack bot token. If not provided, uses SLACK_BOT_TOKEN from settings.
         """
         self.token = token or settings.SLACK_BOT_TOKEN
-        self.client = WebClient(token=self.token) if self.token else None
+        # Every token shares the pooled Slack client; the token goes in each request
+        self.client = get_slack_client() if self.token else None
+        self._auth_headers = slack_auth_headers(self.token)
+    
+    async def _api_call(self, method: str, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Call a Slack Web API method.
+        
+        Args:
+            method: API method name (e.g., 'chat.postMessage')
+            payload: JSON payload for the method
+            
+        Returns:
+            Slack API response data or None if the call failed
+        """
+        try:
+            response = await self.client.post(
+                f"/{method}", content=orjson.dumps(payload), headers=self._auth_headers
+            )
+            response.raise_for_status()
+            raw = response.content
+            data = orjson.loads(raw) if raw else {}
+        except httpx.HTTPError as e:
+            logger.error(f"HTTP error calling Slack {method}: {str(e)}")
+            return None
+        
+        if not data.get("ok", False):
+            logger.error(f"Slack API error from {method}: {data.get('error', 'unknown_error')}")
+            return None
+        
+        return data
     
-    def send_message(
+    async def send_message(
         self, 
         channel: str, 
         text: str, 
         blocks: Optional[List[Dict]] = None,
         thread_ts: Optional[str] = None,
         **kwargs
-    ) -> Optional[SlackResponse]:
+    ) -> Optional[Dict[str, Any]]:
         """Send a message to a Slack channel.
         
         Args:
@@ -35,7 +125,7 @@ class SlackService:
             text: Message text (fallback for notifications)
             blocks: List of block kit blocks for rich formatting
             thread_ts: Timestamp of the thread to reply to
-            **kwargs: Additional arguments to pass to chat_postMessage
+            **kwargs: Additional arguments to pass to chat.postMessage
             
         Returns:
             Slack API response or None if sending failed
@@ -44,28 +134,25 @@ class SlackService:
             logger.warning("Slack client not initialized. Message not sent.")
             return None
             
-        try:
-            response = self.client.chat_postMessage(
-                channel=channel,
-                text=text,
-                blocks=blocks,
-                thread_ts=thread_ts,
-                **kwargs
-            )
+        payload = {"channel": channel, "text": text, **kwargs}
+        if blocks:
+            payload["blocks"] = blocks
+        if thread_ts:
+            payload["thread_ts"] = thread_ts
+        
+        response = await self._api_call("chat.postMessage", payload)
+        if response is not None:
             logger.info(f"Message sent to {channel}: {text[:100]}...")
-            return response
-        except SlackApiError as e:
-            logger.error(f"Error sending message to Slack: {e.response['error']}")
-            return None
+        return response
     
-    def send_scan_results(
+    async def send_scan_results(
         self, 
         channel: str, 
         scan_results: Dict[str, Any],
         repository_name: str,
         repository_url: str,
         pr_url: Optional[str] = None
-    ) -> Optional[SlackResponse]:
+    ) -> Optional[Dict[str, Any]]:
         """Send CI/CD scan results to a Slack channel with interactive buttons.
         
         Args:
@@ -85,108 +172,76 @@ class SlackService:
         # Format the message
         title = f"🚀 CI/CD Scan Results for {repository_name}"
         
-        # Create blocks for the message
-        blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": title,
-                    "emoji": True
-                }
-            },
-            {
-                "type": "section",
-                "text": {
-                    "type": "mrkdwn",
-                    "text": f"*Repository:* <{repository_url}|{repository_name}>\n"
-                            f"*Total Emissions:* {total_emissions:.4f} kg CO₂e\n"
-                            f"*Estimated Cost:* ${total_cost:.4f} USD"
-                }
-            },
-            {
-                "type": "divider"
-            }
-        ]
-        
-        # Add potential savings section if available
+        # Build the potential savings section if available
+        savings_blocks = []
         if potential_savings:
             emissions_savings = potential_savings.get("total_emissions_savings_kg", 0)
             cost_savings = potential_savings.get("total_cost_savings_usd", 0)
             
-            savings_text = (
-                f"*Potential Emissions Savings:* {emissions_savings:.4f} kg CO₂e\n"
-                f"*Potential Cost Savings:* ${cost_savings:.4f} USD\n"
-            )
-            
-            # Add opportunities
-            for opp in potential_savings.get("opportunities", [])[:3]:  # Limit to top 3
-                savings_text += f"• *{opp['type'].title()}*: {opp['description']}\n"
+            savings_lines = [
+                "*💡 Potential Optimizations*",
+                f"*Potential Emissions Savings:* {emissions_savings:.4f} kg CO₂e",
+                f"*Potential Cost Savings:* ${cost_savings:.4f} USD",
+                # Limit to top 3 opportunities
+                *(
+                    f"• *{opp['type'].title()}*: {opp['description']}"
+                    for opp in potential_savings.get("opportunities", [])[:3]
+                )
+            ]
             
-            blocks.extend([
+            savings_blocks = [
                 {
                     "type": "section",
                     "text": {
                         "type": "mrkdwn",
-                        "text": "*💡 Potential Optimizations*\n" + savings_text
+                        "text": "\n".join(savings_lines)
                     }
                 },
-                {
-                    "type": "divider"
-                }
-            ])
+                _DIVIDER
+            ]
         
         # Add actions (buttons)
-        actions = []
-        
-        if pr_url:
-            actions.append({
-                "type": "button",
-                "text": {
-                    "type": "plain_text",
-                    "text": "View Pull Request",
-                    "emoji": True
-                },
-                "url": pr_url,
-                "style": "primary"
-            })
+        actions = [
+            *([_view_pr_button(pr_url)] if pr_url else []),
+            _view_full_report_button(repository_url),
+            _DISMISS_BUTTON
+        ]
         
-        actions.extend([
+        # Create blocks for the message in one pass
+        blocks = [
             {
-                "type": "button",
+                "type": "header",
                 "text": {
                     "type": "plain_text",
-                    "text": "View Full Report",
+                    "text": title,
                     "emoji": True
-                },
-                "url": f"{repository_url}/actions",
-                "style": "primary"
+                }
             },
             {
-                "type": "button",
+                "type": "section",
                 "text": {
-                    "type": "plain_text",
-                    "text": "Dismiss",
-                    "emoji": True
-                },
-                "value": "dismiss",
-                "style": "danger"
+                    "type": "mrkdwn",
+                    "text": f"*Repository:* <{repository_url}|{repository_name}>\n"
+                            f"*Total Emissions:* {total_emissions:.4f} kg CO₂e\n"
+                            f"*Estimated Cost:* ${total_cost:.4f} USD"
+                }
+            },
+            _DIVIDER,
+            *savings_blocks,
+            {
+                "type": "actions",
+                "elements": actions
             }
-        ])
-        
-        blocks.append({
-            "type": "actions",
-            "elements": actions
-        })
+        ]
         
         # Send the message
-        return self.send_message(
+        return await self.send_message(
             channel=channel,
             text=title,
             blocks=blocks
         )
     
-    def send_approval_request(
+    async def send_approval_request(
         self,
         channel: str,
         pr_title: str,
@@ -194,7 +249,7 @@ class SlackService:
         repository_name: str,
         changes: List[Dict[str, str]],
         approvers: List[str] = None
-    ) -> Optional[SlackResponse]:
+    ) -> Optional[Dict[str, Any]]:
         """Send a pull request approval request to a Slack channel.
         
         Args:
@@ -214,25 +269,18 @@ class SlackService:
             mentions = [f"<@{user}>" for user in approvers]
             approvers_text = f"*Approvers:* {' '.join(mentions)}\n\n"
         
-        # Format changes
-        changes_text = "*Changes in this PR:*\n"
-        for i, change in enumerate(changes[:5], 1):  # Limit to 5 changes
-            changes_text += f"{i}. {change.get('description', 'No description')} "
-            changes_text += f"(*{change.get('type', 'change')}*)\n"
+        # Format changes (limit to 5)
+        changes_text = "*Changes in this PR:*\n" + "\n".join(
+            f"{i}. {change.get('description', 'No description')} (*{change.get('type', 'change')}*)"
+            for i, change in enumerate(changes[:5], 1)
+        )
         
         if len(changes) > 5:
-            changes_text += f"\n...and {len(changes) - 5} more changes"
+            changes_text += f"\n\n...and {len(changes) - 5} more changes"
         
         # Create blocks
         blocks = [
-            {
-                "type": "header",
-                "text": {
-                    "type": "plain_text",
-                    "text": "✅ Pull Request Approval Requested",
-                    "emoji": True
-                }
-            },
+            _APPROVAL_HEADER,
             {
                 "type": "section",
                 "text": {
@@ -242,16 +290,7 @@ class SlackService:
                             f"{approvers_text}\n"
                             f"{changes_text}"
                 },
-                "accessory": {
-                    "type": "button",
-                    "text": {
-                        "type": "plain_text",
-                        "text": "View PR",
-                        "emoji": True
-                    },
-                    "url": pr_url,
-                    "style": "primary"
-                }
+                "accessory": _view_pr_button(pr_url, text="View PR")
             },
             {
                 "type": "actions",
@@ -266,43 +305,26 @@ class SlackService:
                         "value": f"approve_pr:{repository_name}:{pr_url.split('/')[-1]}",
                         "style": "primary"
                     },
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "Request Changes",
-                            "emoji": True
-                        },
-                        "value": "request_changes",
-                        "style": "danger"
-                    },
-                    {
-                        "type": "button",
-                        "text": {
-                            "type": "plain_text",
-                            "text": "View Details",
-                            "emoji": True
-                        },
-                        "url": pr_url
-                    }
+                    _REQUEST_CHANGES_BUTTON,
+                    _url_button("View Details", pr_url)
                 ]
             }
         ]
         
-        return self.send_message(
+        return await self.send_message(
             channel=channel,
             text=f"Approval requested for PR: {pr_title}",
             blocks=blocks
         )
     
-    def update_message(
+    async def update_message(
         self, 
         channel: str, 
         ts: str, 
         text: str, 
         blocks: Optional[List[Dict]] = None,
         **kwargs
-    ) -> Optional[SlackResponse]:
+    ) -> Optional[Dict[str, Any]]:
         """Update an existing Slack message.
         
         Args:
@@ -310,7 +332,7 @@ class SlackService:
             ts: Timestamp of the message to update
             text: New message text
             blocks: New blocks for the message
-            **kwargs: Additional arguments to pass to chat_update
+            **kwargs: Additional arguments to pass to chat.update
             
         Returns:
             Slack API response or None if update failed
@@ -319,19 +341,14 @@ class SlackService:
             logger.warning("Slack client not initialized. Message not updated.")
             return None
             
-        try:
-            response = self.client.chat_update(
-                channel=channel,
-                ts=ts,
-                text=text,
-                blocks=blocks,
-                **kwargs
-            )
+        payload = {"channel": channel, "ts": ts, "text": text, **kwargs}
+        if blocks is not None:
+            payload["blocks"] = blocks
+        
+        response = await self._api_call("chat.update", payload)
+        if response is not None:
             logger.info(f"Message {ts} in {channel} updated")
-            return response
-        except SlackApiError as e:
-            logger.error(f"Error updating Slack message: {e.response['error']}")
-            return None
+        return response
     
     def handle_interaction(self, payload: Dict[str, Any]) -> Optional[Dict[str, Any]]:
         """Handle Slack interactive component interactions.
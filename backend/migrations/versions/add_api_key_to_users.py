@@ -17,9 +17,16 @@ depends_on = None
 def upgrade():
     # Add api_key column to users table
     op.add_column('users', 
-        sa.Column('api_key', sa.String(length=64), unique=True, index=True, nullable=True)
+        sa.Column('api_key', sa.String(length=64), nullable=True)
+    )
+    # Partial unique index: most users have no key, and NULL rows are never looked up
+    op.create_index(
+        'ix_users_api_key', 'users', ['api_key'], unique=True,
+        postgresql_where=sa.text('api_key IS NOT NULL'),
+        sqlite_where=sa.text('api_key IS NOT NULL')
     )
 
 def downgrade():
-    # Drop the api_key column
+    # Drop the api_key index and column
+    op.drop_index('ix_users_api_key', table_name='users')
     op.drop_column('users', 'api_key')
@@ -0,0 +1,28 @@
+"""Store large scan finding fields as TEXT
+
+Revision ID: scan_finding_text_columns
+Revises: add_api_key_to_users
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'scan_finding_text_columns'
+down_revision = 'add_api_key_to_users'
+branch_labels = None
+depends_on = None
+
+COLUMNS = ('description', 'code_snippet', 'recommended_fix')
+
+def upgrade():
+    # Unbounded TEXT lets Postgres move oversized values out of line
+    with op.batch_alter_table('scan_findings') as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(column, type_=sa.Text(), existing_type=sa.String(length=2000))
+
+def downgrade():
+    with op.batch_alter_table('scan_findings') as batch_op:
+        for column in COLUMNS:
+            batch_op.alter_column(column, type_=sa.String(length=2000), existing_type=sa.Text())
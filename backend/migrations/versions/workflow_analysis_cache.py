@@ -0,0 +1,35 @@
+"""Add workflow analysis cache
+
+Revision ID: workflow_analysis_cache
+Revises: scan_finding_text_columns
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'workflow_analysis_cache'
+down_revision = 'scan_finding_text_columns'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Create the workflow_analysis_cache table
+    op.create_table('workflow_analysis_cache',
+        sa.Column('id', sa.Integer(), primary_key=True, index=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=False),
+        sa.Column('deleted_at', sa.DateTime(), nullable=True),
+        sa.Column('owner', sa.String(length=255), nullable=False),
+        sa.Column('repo', sa.String(length=255), nullable=False),
+        sa.Column('path', sa.String(length=1000), nullable=False),
+        sa.Column('contents_etag', sa.String(length=255), nullable=True),
+        sa.Column('runs_etag', sa.String(length=255), nullable=True),
+        sa.Column('analysis', sa.JSON(), nullable=False),
+        sa.UniqueConstraint('owner', 'repo', 'path')
+    )
+
+def downgrade():
+    # Drop the workflow_analysis_cache table
+    op.drop_table('workflow_analysis_cache')
@@ -4,31 +4,55 @@ Development tools for testing without webhooks.
 import os
 import json
 import asyncio
+import argparse
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
 
 import httpx
+import orjson
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
 BASE_URL = "http://localhost:8000"
+_FIXTURES_DIR = Path(__file__).parent.parent / "tests" / "fixtures" / "github_events"
 
+# Shared by every trigger_event call so repeated events reuse the connection
+_client: Optional[httpx.AsyncClient] = None
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            base_url=BASE_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=85.0)
+        )
+    return _client
+
+async def close_client() -> None:
+    """Close the shared HTTP client."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+@lru_cache(maxsize=64)
 def load_fixture(event_type: str) -> Dict[str, Any]:
-    """Load a GitHub webhook event fixture."""
-    fixtures_dir = Path(__file__).parent.parent / "tests" / "fixtures" / "github_events"
-    fixture_path = fixtures_dir / f"{event_type}.json"
+    """Load a GitHub webhook event fixture, parsing each one only once."""
+    fixture_path = _FIXTURES_DIR / f"{event_type}.json"
     
     if not fixture_path.exists():
-        available = [f.stem for f in fixtures_dir.glob("*.json")]
+        available = [f.stem for f in _FIXTURES_DIR.glob("*.json")]
         raise ValueError(
             f"No fixture found for {event_type}. "
             f"Available fixtures: {', '.join(available)}"
         )
     
-    with open(fixture_path, 'r') as f:
-        return json.load(f)
+    return orjson.loads(fixture_path.read_bytes())
 
 async def trigger_event(event_type: str, payload: Dict[str, Any] = None) -> Dict[str, Any]:
     """Trigger a GitHub webhook event."""
@@ -41,42 +65,61 @@ async def trigger_event(event_type: str, payload: Dict[str, Any] = None) -> Dict
     }
     
     # In development mode, use the direct endpoint
-    url = f"{BASE_URL}/api/dev/trigger-event"
-    
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=payload, headers=headers)
+    response = await get_client().post("/api/dev/trigger-event", json=payload, headers=headers)
     
     return {
         "status": response.status_code,
         "data": response.json()
     }
 
-async def main():
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Trigger GitHub webhook events locally.")
+    parser.add_argument("events", nargs="*", help="Event fixtures to trigger (e.g. push pull_request)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Maximum events in flight at once")
+    parser.add_argument("--list", action="store_true", help="List available events and exit")
+    return parser.parse_args(argv)
+
+async def main(args: argparse.Namespace):
     """Run the development tools."""
-    print("Available commands:")
-    print("1. Trigger push event")
-    print("2. Trigger pull request event")
-    print("3. List available events")
+    if args.list or not args.events:
+        print("Available events:")
+        for fixture in sorted(_FIXTURES_DIR.glob("*.json")):
+            print(f"- {fixture.stem}")
+        return
     
-    choice = input("Enter your choice (1-3): ")
+    # Fire events concurrently through the shared client
+    semaphore = asyncio.Semaphore(max(args.concurrency, 1))
     
-    if choice == "1":
-        result = await trigger_event("push")
-    elif choice == "2":
-        result = await trigger_event("pull_request")
-    elif choice == "3":
-        fixtures_dir = Path(__file__).parent.parent / "tests" / "fixtures" / "github_events"
-        events = [f.stem for f in fixtures_dir.glob("*.json")]
-        print("\nAvailable events:")
-        for event in events:
-            print(f"- {event}")
-        return
-    else:
-        print("Invalid choice")
-        return
+    async def bounded_trigger(event_type: str) -> Dict[str, Any]:
+        async with semaphore:
+            return await trigger_event(event_type)
     
-    print("\nResponse:")
-    print(json.dumps(result, indent=2))
+    results = await asyncio.gather(
+        *(bounded_trigger(event) for event in args.events),
+        return_exceptions=True
+    )
+    
+    for event, result in zip(args.events, results):
+        print(f"\nResponse for {event}:")
+        if isinstance(result, Exception):
+            print(f"Error: {str(result)}")
+        else:
+            print(json.dumps(result, indent=2))
+
+async def run(args: argparse.Namespace) -> None:
+    """Run the development tools and close the shared client afterwards."""
+    try:
+        await main(args)
+    finally:
+        await close_client()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # uvloop speeds up the event loop when available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
+    asyncio.run(run(parse_args()))
@@ -11,21 +11,26 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from app.models.base import Base
 from app.core.config import settings
 
 def init_db():
     """Initialize the database with all tables."""
-    # Create database directory if it doesn't exist
-    db_path = Path("./ecoci.db")
-    db_path.parent.mkdir(exist_ok=True)
+    url = make_url(settings.DATABASE_URL)
     
-    # Create SQLAlchemy engine
-    engine = create_engine(settings.DATABASE_URL, echo=True)
+    # Create database directory if it doesn't exist (file-based SQLite only)
+    if url.get_backend_name() == "sqlite" and url.database and url.database != ":memory:":
+        Path(url.database).parent.mkdir(parents=True, exist_ok=True)
     
-    # Create all tables
+    # Create SQLAlchemy engine; set DB_ECHO=true to log the DDL
+    echo = os.getenv("DB_ECHO", "False").lower() == "true"
+    engine = create_engine(url, echo=echo, future=True)
+    
+    # Create all tables in a single transaction
     print("Creating database tables...")
-    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        Base.metadata.create_all(bind=conn)
     print("Database initialized successfully!")
 
 if __name__ == "__main__":
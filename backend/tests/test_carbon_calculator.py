@@ -0,0 +1,55 @@
+from app.services.carbon_calculator import CarbonCalculator
+
+
+def make_job(job_id, started_at, completed_at):
+    return {
+        "id": job_id,
+        "name": f"job-{job_id}",
+        "started_at": started_at,
+        "completed_at": completed_at,
+        "labels": ["ubuntu-latest"],
+    }
+
+
+def analyze(jobs):
+    calculator = CarbonCalculator(carbon_intensity=0.5, cost_per_kwh=0.12)
+    workflow_data = {
+        "id": 1,
+        "name": "CI",
+        "run_id": 100,
+        "run_number": 7,
+        "event": "push",
+        "status": "completed",
+        "created_at": "2024-01-01T00:00:00Z",
+        "updated_at": "2024-01-01T00:10:00Z",
+    }
+    return calculator.analyze_workflow_run(workflow_data, jobs)
+
+
+def test_zero_duration_job_is_skipped_by_scheduling_analysis():
+    jobs = [
+        make_job(1, "2024-01-01T00:00:00Z", "2024-01-01T00:00:00Z"),
+        make_job(2, "2024-01-01T00:01:00Z", "2024-01-01T00:05:00Z"),
+    ]
+
+    result = analyze(jobs)
+
+    opportunity_types = {opp["type"] for opp in result["potential_savings"]["opportunities"]}
+    assert "parallelization" not in opportunity_types
+
+
+def test_sequential_jobs_report_parallelization_savings():
+    jobs = [
+        make_job(1, "2024-01-01T00:00:00Z", "2024-01-01T00:02:00Z"),
+        make_job(2, "2024-01-01T00:03:00Z", "2024-01-01T00:05:00Z"),
+    ]
+
+    result = analyze(jobs)
+
+    parallelization = [
+        opp for opp in result["potential_savings"]["opportunities"]
+        if opp["type"] == "parallelization"
+    ]
+    assert len(parallelization) == 1
+    assert parallelization[0]["jobs_affected"] == 2
+    assert parallelization[0]["emissions_savings_kg"] > 0
@@ -4,39 +4,65 @@ This script helps set up the local development environment by creating a .env fi
 from .env.example and initializing the database.
 """
 import os
-import shutil
-from pathlib import Path
+import sys
+
+# Resolved once at import; setup_environment only does the I/O.
+# Plain os.path strings keep pathlib (and its imports) out of startup.
+_ROOT = os.path.dirname(os.path.realpath(__file__))
+_TEMPLATES = (
+    (".env.example", ".env"),
+    ("config.example.yaml", "config.local.yaml"),
+)
+
+_INSTRUCTIONS = (
+    "\nTo initialize the database, run:\n"
+    "cd backend\n"
+    "python -m scripts.init_db\n"
+    "\nTo start the development server, run:\n"
+    "cd backend\n"
+    "uvicorn app.main:app --reload\n"
+)
+
+def _fastcopy(src: str, dst: str) -> None:
+    """Copy a file in the kernel where possible, falling back to a buffered copy."""
+    with open(src, "rb") as source, open(dst, "wb") as target:
+        remaining = os.fstat(source.fileno()).st_size
+        try:
+            # copy_file_range (Linux 4.5+) may copy less than asked, so loop
+            while remaining > 0:
+                copied = os.copy_file_range(source.fileno(), target.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        except (AttributeError, OSError):
+            # Only imported when the kernel copy isn't available
+            import shutil
+            
+            source.seek(0)
+            target.seek(0)
+            target.truncate()
+            shutil.copyfileobj(source, target, 1 << 16)
 
 def setup_environment():
     """Set up the local development environment."""
-    # Paths
-    root_dir = Path(__file__).parent
-    env_example = root_dir / ".env.example"
-    env_file = root_dir / ".env"
-    
-    # Create .env from .env.example if it doesn't exist
-    if not env_file.exists() and env_example.exists():
-        print(f"Creating {env_file} from {env_example}...")
-        shutil.copy(env_example, env_file)
-        print(f"Created {env_file}. Please update it with your configuration.")
-    
-    # Create config.local.yaml from config.example.yaml if it doesn't exist
-    config_example = root_dir / "config.example.yaml"
-    config_file = root_dir / "config.local.yaml"
-    
-    if not config_file.exists() and config_example.exists():
-        print(f"Creating {config_file} from {config_example}...")
-        shutil.copy(config_example, config_file)
-        print(f"Created {config_file}. Please update it with your configuration.")
+    # One directory listing answers every existence check below
+    existing = set(os.listdir(_ROOT))
     
-    # Initialize the database
-    print("\nTo initialize the database, run:")
-    print("cd backend")
-    print("python -m scripts.init_db")
+    # Create each local file from its example if it doesn't exist
+    messages = []
+    for example_name, target_name in _TEMPLATES:
+        if target_name in existing or example_name not in existing:
+            continue
+        example = os.path.join(_ROOT, example_name)
+        target = os.path.join(_ROOT, target_name)
+        _fastcopy(example, target)
+        messages.append(
+            f"Created {target} from {example}. Please update it with your configuration.\n"
+        )
     
-    print("\nTo start the development server, run:")
-    print("cd backend")
-    print("uvicorn app.main:app --reload")
+    # Emit everything, including the database instructions, in one write
+    messages.append(_INSTRUCTIONS)
+    sys.stdout.write("".join(messages))
 
 if __name__ == "__main__":
     setup_environment()